@@ -0,0 +1,160 @@
+"""
+BIDIRECTIONAL BFS
+=================
+Point-to-point shortest path on unweighted graphs, searching from both ends
+"""
+
+from array import array
+
+# WHY?
+# Plain BFS from s explores everything closer than t: ~b^d nodes
+# Searching from s AND t, always growing the SMALLER frontier,
+# the two balls meet halfway: ~2 * b^(d/2) nodes
+#
+# Correctness: expand one FULL level at a time and, if the searches meet
+# during that level, keep the best meeting point of the whole level.
+#
+# Buffer reuse: visited marks are query stamps (seen[v] == stamp), so a new
+# query bumps the stamp instead of clearing O(n) arrays.
+
+
+class BidirectionalBFS:
+    """Reusable searcher over list-of-lists / dict adjacency or a CSRGraph.
+
+    reverse: adjacency of the transposed graph for directed inputs;
+             omit it for undirected graphs (the same adjacency is used).
+    """
+
+    def __init__(self, graph, reverse=None, n=None):
+        self._fwd = self._neighbors_fn(graph)
+        self._bwd = self._neighbors_fn(reverse) if reverse is not None else self._fwd
+        if n is None:
+            n = graph.n if hasattr(graph, "indptr") else len(graph)
+        self.n = n
+        self._stamp = 0
+        self._seen_f = array('I', bytes(4 * n))
+        self._seen_b = array('I', bytes(4 * n))
+        self._dist_f = array('i', bytes(4 * n))
+        self._dist_b = array('i', bytes(4 * n))
+        self._par_f = array('i', bytes(4 * n))
+        self._par_b = array('i', bytes(4 * n))
+
+    @staticmethod
+    def _neighbors_fn(graph):
+        if hasattr(graph, "indptr"):
+            # CSRGraph: zero-copy memoryviews, slicing yields plain ints
+            ptr = memoryview(graph.indptr)
+            idx = memoryview(graph.indices)
+            return lambda u: idx[ptr[u]:ptr[u + 1]]
+        if isinstance(graph, dict):
+            return lambda u: graph.get(u, ())
+        return graph.__getitem__
+
+    def _search(self, s, t):
+        # Returns the meeting node or -1
+        self._stamp += 1
+        if self._stamp == 1 << 32:  # stamp wrapped: clear once
+            self._stamp = 1
+            for buf in (self._seen_f, self._seen_b):
+                buf[:] = array('I', bytes(4 * self.n))
+        stamp = self._stamp
+        seen_f, seen_b = self._seen_f, self._seen_b
+        dist_f, dist_b = self._dist_f, self._dist_b
+        par_f, par_b = self._par_f, self._par_b
+
+        seen_f[s] = stamp
+        dist_f[s] = 0
+        par_f[s] = -1
+        seen_b[t] = stamp
+        dist_b[t] = 0
+        par_b[t] = -1
+        if s == t:
+            return s
+        front_f = [s]
+        front_b = [t]
+
+        while front_f and front_b:
+            # Grow the smaller side by one full level
+            if len(front_f) <= len(front_b):
+                front, nbrs = front_f, self._fwd
+                seen, dist, par = seen_f, dist_f, par_f
+                other_seen, other_dist = seen_b, dist_b
+            else:
+                front, nbrs = front_b, self._bwd
+                seen, dist, par = seen_b, dist_b, par_b
+                other_seen, other_dist = seen_f, dist_f
+
+            nxt = []
+            best = -1
+            best_len = 1 << 62
+            for u in front:
+                du = dist[u] + 1
+                for v in nbrs(u):
+                    if seen[v] == stamp:
+                        continue
+                    seen[v] = stamp
+                    dist[v] = du
+                    par[v] = u
+                    if other_seen[v] == stamp:
+                        total = du + other_dist[v]
+                        if total < best_len:
+                            best, best_len = v, total
+                    nxt.append(v)
+            if best >= 0:
+                return best
+            if front is front_f:
+                front_f = nxt
+            else:
+                front_b = nxt
+        return -1
+
+    def distance(self, s, t):
+        """Number of edges on a shortest s -> t path, -1 if unreachable."""
+        meet = self._search(s, t)
+        if meet < 0:
+            return -1
+        return self._dist_f[meet] + self._dist_b[meet]
+
+    def shortest_path(self, s, t):
+        """Node list [s, ..., t], or None if unreachable."""
+        meet = self._search(s, t)
+        if meet < 0:
+            return None
+        path = []
+        v = meet
+        while v != -1:
+            path.append(v)
+            v = self._par_f[v]
+        path.reverse()
+        v = self._par_b[meet]
+        while v != -1:
+            path.append(v)
+            v = self._par_b[v]
+        return path
+
+    # BATCH MODE - all buffers are shared across the queries
+    def distances(self, pairs):
+        return [self.distance(s, t) for s, t in pairs]
+
+    def shortest_paths(self, pairs):
+        return [self.shortest_path(s, t) for s, t in pairs]
+
+
+def bidirectional_bfs(graph, s, t, reverse=None):
+    """One-off query; build a BidirectionalBFS to reuse buffers."""
+    return BidirectionalBFS(graph, reverse).shortest_path(s, t)
+
+
+# USAGE
+# adj = [[1], [0, 2], [1]]
+# bidirectional_bfs(adj, 0, 2)                  # [0, 1, 2]
+# searcher = BidirectionalBFS(csr_graph)        # CSRGraph from python_csr_graph_ref
+# searcher.distances([(0, 9), (3, 7)])          # many pairs, no re-allocation
+# BidirectionalBFS(g, reverse=g.reverse())      # directed CSR graph
+
+# NOTE: nodes must be 0..n-1 (dict adjacency: pass n=...)
+# NOTE: one searcher is not thread-safe (shared buffers)
+
+# TIME COMPLEXITY
+# O(b^(d/2)) typical per query vs O(n + m) for full BFS (same worst case)
+# Memory: 6 int arrays of size n, allocated once per searcher
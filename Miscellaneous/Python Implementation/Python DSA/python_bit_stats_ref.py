@@ -0,0 +1,116 @@
+"""
+VECTORIZED BIT STATISTICS
+=========================
+trailing zeros / popcount / bit_length over whole NumPy arrays
+"""
+
+import numpy as np
+
+# SCALAR VERSIONS (see python_bits_ref.py)
+# lowbit         = x & -x
+# trailing zeros = (x & -x).bit_length() - 1
+# popcount       = x.bit_count()  /  bin(x).count('1')
+# highest bit    = x.bit_length() - 1
+#
+# Here each one is a few array-wide passes instead of a Python loop.
+# Negative values follow Python: bit_length / popcount use abs(x).
+
+U64 = np.uint64
+
+
+def _as_u64(x):
+    x = np.asarray(x)
+    if x.dtype.kind == 'i':
+        # abs() then reinterpret: -2^63 stays 2^63 as uint64, like Python
+        return np.abs(x.astype(np.int64, copy=False)).view(U64)
+    if x.dtype.kind != 'u':
+        x = x.astype(np.int64)
+        return np.abs(x).view(U64)
+    return x.astype(U64, copy=False)
+
+
+def _raw_u64(x):
+    # Same bits, no abs(): enough wherever tz(-x) == tz(x)
+    x = np.asarray(x)
+    if x.dtype.kind not in 'iu':
+        x = x.astype(np.int64)
+    return x.astype(np.int64 if x.dtype.kind == 'i' else U64, copy=False).view(U64)
+
+
+# LOWBIT: x & -x  (two's complement works on the raw bits)
+def lowbit(x):
+    x = _raw_u64(x)
+    return x & (~x + U64(1))
+
+
+# BIT LENGTH - binary search on the shift, 6 passes for 64 bits
+def bit_length(x):
+    x = _as_u64(x).copy()
+    n = np.zeros(x.shape, dtype=np.int64)
+    for s in (32, 16, 8, 4, 2, 1):
+        big = x >= U64(1 << s)
+        n[big] += s
+        x[big] >>= U64(s)
+    n += x != 0
+    return n
+
+
+def highest_bit(x):
+    # Index of the highest set bit, -1 for 0
+    return bit_length(x) - 1
+
+
+# TRAILING ZEROS
+# x & -x is a power of two, and powers of two are exact in float64,
+# so frexp's exponent IS its bit_length: one pass, no loop over bits
+def trailing_zeros(x):
+    # (x & -x).bit_length() - 1  ->  -1 for 0
+    low = lowbit(x)
+    _, exp = np.frexp(low.astype(np.float64))
+    return exp.astype(np.int64) - 1
+
+
+# POPCOUNT
+def popcount(x):
+    x = _as_u64(x)
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(x).astype(np.int64)
+    # SWAR: sum bits in 2-, 4-, 8-bit groups, then gather bytes by multiply
+    x = x - ((x >> U64(1)) & U64(0x5555555555555555))
+    x = (x & U64(0x3333333333333333)) + ((x >> U64(2)) & U64(0x3333333333333333))
+    x = (x + (x >> U64(4))) & U64(0x0F0F0F0F0F0F0F0F)
+    return ((x * U64(0x0101010101010101)) >> U64(56)).astype(np.int64)
+
+
+# MIN TRAILING ZEROS OF A WHOLE ARRAY - a single reduction
+# tz(a | b) = min(tz(a), tz(b)), so OR everything and look once
+# (tz(-x) == tz(x), so signed input needs no abs() pass)
+def min_trailing_zeros(arr):
+    arr = np.asarray(arr)
+    if arr.dtype.kind not in 'iu':
+        arr = arr.astype(np.int64)
+    acc = int(np.bitwise_or.reduce(arr, axis=None)) if arr.size else 0
+    return (acc & -acc).bit_length() - 1
+
+
+# CP EXAMPLE - P. Minimize Number
+# "divide all by 2 while all are even" = min trailing zeros over the array
+def minimize_number(arr):
+    return min_trailing_zeros(np.asarray(arr, dtype=np.int64))
+
+
+# USAGE
+# a = np.array([8, 12, 40])
+# trailing_zeros(a)        # [3, 2, 3]
+# popcount(a)              # [1, 2, 2]
+# bit_length(a)            # [4, 4, 6]
+# highest_bit(a)           # [3, 3, 5]
+# min_trailing_zeros(a)    # 2
+
+# NOTE: 0 has no set bit -> trailing_zeros / highest_bit / min_* give -1
+# NOTE: results are int64 arrays with the input's shape
+
+# TIME COMPLEXITY
+# lowbit, trailing_zeros, popcount: O(n), 1-4 array passes
+# bit_length: O(n), 6 array passes
+# min_trailing_zeros: O(n), one reduction
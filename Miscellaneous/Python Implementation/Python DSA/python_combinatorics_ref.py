@@ -0,0 +1,153 @@
+"""
+COMBINATORICS (nCr MOD P)
+=========================
+Factorial / inverse-factorial tables for O(1) nCr, nPr, Catalan
+"""
+
+from array import array
+
+import numpy as np
+
+MOD = 10**9 + 7
+
+# WHY TABLES?
+# pow(x, MOD - 2, MOD) per query = O(log MOD) each
+# fact + inv_fact tables = O(n) once, then O(1) per query
+#
+# inv_fact[n] = pow(fact[n], MOD - 2, MOD)   # ONE modular inverse
+# inv_fact[i - 1] = inv_fact[i] * i           # walk down, no more pow()
+
+
+class Combinatorics:
+    """nCr / nPr / Catalan mod a prime, tables grow lazily on demand."""
+
+    def __init__(self, n=1, mod=MOD):
+        self.mod = mod
+        self.fact = array('q', [1])
+        self.inv_fact = array('q', [1])
+        self._np_cache = None
+        self.reserve(n)
+
+    def reserve(self, n):
+        # Grow tables to cover 0..n (doubling keeps total work O(n))
+        size = len(self.fact)
+        if n < size:
+            return
+        if n >= self.mod:
+            raise ValueError("n must be smaller than the prime modulus")
+        new_size = min(max(n + 1, 2 * size), self.mod)
+        mod = self.mod
+        # NumPy views pin the buffers - drop them before resizing
+        self._np_cache = None
+
+        fact = self.fact
+        f = fact[-1]
+        for i in range(size, new_size):
+            f = f * i % mod
+            fact.append(f)
+
+        # Inverse of the new top, then walk down to the old top
+        extra = array('q', bytes(8 * (new_size - size)))
+        inv = pow(fact[new_size - 1], mod - 2, mod)
+        for i in range(new_size - 1, size - 1, -1):
+            extra[i - size] = inv
+            inv = inv * i % mod
+        self.inv_fact.extend(extra)
+
+    # SCALAR QUERIES - O(1) after reserve
+    def nCr(self, n, r):
+        if r < 0 or n < 0 or r > n:
+            return 0
+        if n >= len(self.fact):
+            self.reserve(n)
+        return self.fact[n] * self.inv_fact[r] % self.mod * self.inv_fact[n - r] % self.mod
+
+    def nPr(self, n, r):
+        if r < 0 or n < 0 or r > n:
+            return 0
+        if n >= len(self.fact):
+            self.reserve(n)
+        return self.fact[n] * self.inv_fact[n - r] % self.mod
+
+    def catalan(self, n):
+        # C(2n, n) / (n + 1)
+        if n < 0:
+            return 0
+        if 2 * n + 1 >= len(self.fact):
+            self.reserve(2 * n + 1)
+        return self.nCr(2 * n, n) * self.fact[n] % self.mod * self.inv_fact[n + 1] % self.mod
+
+    def factorial(self, n):
+        if n < 0:
+            raise ValueError("n must be >= 0")  # a[-1] would read the table end
+        if n >= len(self.fact):
+            self.reserve(n)
+        return self.fact[n]
+
+    def inv_factorial(self, n):
+        if n < 0:
+            raise ValueError("n must be >= 0")  # a[-1] would read the table end
+        if n >= len(self.fact):
+            self.reserve(n)
+        return self.inv_fact[n]
+
+    # BATCH QUERIES (NumPy) - one vectorized pass over all queries
+    def _tables(self):
+        # Zero-copy int64 views over the array('q') buffers
+        if self._np_cache is None:
+            self._np_cache = (np.frombuffer(self.fact, dtype=np.int64),
+                              np.frombuffer(self.inv_fact, dtype=np.int64))
+        return self._np_cache
+
+    def nCr_many(self, n, r):
+        n = np.asarray(n, dtype=np.int64)
+        r = np.asarray(r, dtype=np.int64)
+        ok = (r >= 0) & (n >= 0) & (r <= n)
+        # Invalid queries read index 0 and are zeroed afterwards
+        # (np.where, not res[~ok]: scalars and broadcast shapes work too)
+        n0 = np.where(ok, n, 0)
+        r0 = np.where(ok, r, 0)
+        self.reserve(int(n0.max(initial=0)))
+        fact, inv_fact = self._tables()
+        # Table values < mod < 2^31, so every product fits in int64
+        res = fact[n0] * inv_fact[r0] % self.mod * inv_fact[n0 - r0] % self.mod
+        return np.where(ok, res, 0)
+
+    def nPr_many(self, n, r):
+        n = np.asarray(n, dtype=np.int64)
+        r = np.asarray(r, dtype=np.int64)
+        ok = (r >= 0) & (n >= 0) & (r <= n)
+        n0 = np.where(ok, n, 0)
+        r0 = np.where(ok, r, 0)
+        self.reserve(int(n0.max(initial=0)))
+        fact, inv_fact = self._tables()
+        res = fact[n0] * inv_fact[n0 - r0] % self.mod
+        return np.where(ok, res, 0)
+
+    def catalan_many(self, n):
+        n = np.asarray(n, dtype=np.int64)
+        ok = n >= 0
+        n0 = np.where(ok, n, 0)
+        self.reserve(2 * int(n0.max(initial=0)) + 1)
+        fact, inv_fact = self._tables()
+        mod = self.mod
+        res = fact[2 * n0] * inv_fact[n0] % mod * inv_fact[n0 + 1] % mod
+        return np.where(ok, res, 0)
+
+
+# USAGE
+# comb = Combinatorics(2 * 10**6)
+# comb.nCr(10, 3)                       # 120
+# comb.catalan(5)                       # 42
+# comb.nCr_many([10, 5, 3], [3, 2, 5])  # array([120, 10, 0])
+# comb.nCr(5 * 10**6, 7)                # tables grow automatically
+
+# NOTE: mod must be prime (inverses via Fermat) and every n < mod
+# NOTE: *_many needs mod < 2^31 so products fit in int64
+# NOTE: batch results are int64 arrays, scalar results are Python ints
+
+# TIME COMPLEXITY
+# Build / grow to n: O(n) + one pow()
+# nCr, nPr, catalan: O(1)
+# *_many: O(q) vectorized
+# Memory: 16 bytes per table entry (two int64 arrays)
@@ -0,0 +1,342 @@
+"""
+CSES GRAPH BENCHMARK SUITE
+==========================
+Max-size inputs, runtime + peak memory per Python implementation
+"""
+
+import argparse
+import gc
+import heapq
+import json
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from python_bidirectional_bfs_ref import BidirectionalBFS
+from python_csr_graph_ref import edges_from_ints, parse_ints
+from python_dsu_ref import DSU
+from python_frontier_bfs_ref import message_route as frontier_message_route
+from python_grid_bfs_ref import Grid
+from python_grid_bfs_ref import labyrinth as grid_labyrinth
+from python_shortest_path_ref import dijkstra
+
+# WHY?
+# "Is the new engine faster?" needs the same inputs, the same answer check
+# and the same measurements every time. Each workload here is:
+#   generator(scale, seed) -> raw CSES-format input bytes
+#   {implementation name: solve(data) -> comparable answer}
+# Every solver starts from the raw bytes (parsing counts, as on the judge).
+#
+# Measured per implementation:
+#   time  best of `repeat` runs, perf_counter
+#   peak  separate run under tracemalloc (NumPy buffers are tracked too)
+#
+# Run:  python python_cses_graph_bench.py                    # everything
+#       python python_cses_graph_bench.py labyrinth --scale 0.1
+#       python python_cses_graph_bench.py --json > results.jsonl
+#
+# Add an engine: append a solver to WORKLOADS[name][1].
+
+
+# INPUT GENERATORS (CSES limits at scale=1)
+
+def gen_grid(scale=1.0, seed=0, wall=0.4, endpoints=False):
+    """n x m grid of '.' / '#', n = m = 1000 at scale 1."""
+    side = max(2, int(1000 * scale ** 0.5))
+    rng = np.random.default_rng(seed)
+    cells = np.where(rng.random((side, side)) < wall, ord("#"), ord(".")).astype(np.uint8)
+    if endpoints:
+        # open corners so A and B are (almost surely) on the giant component
+        cells[:3, :3] = cells[-3:, -3:] = ord(".")
+        cells[0, 0] = ord("A")
+        cells[-1, -1] = ord("B")
+    body = b"\n".join(row.tobytes() for row in cells)
+    return b"%d %d\n" % (side, side) + body + b"\n"
+
+
+def gen_labyrinth(scale=1.0, seed=0):
+    return gen_grid(scale, seed, wall=0.3, endpoints=True)
+
+
+def gen_graph(scale=1.0, seed=0, weighted=False, path=False):
+    """n = 10^5 nodes, m = 2 * 10^5 edges at scale 1, 1-indexed.
+
+    path=True hides a 1 -> 2 -> ... -> n chain among the edges so every
+    node is reachable (Shortest Routes guarantees that).
+    """
+    n = max(2, int(10**5 * scale))
+    m = max(n, int(2 * 10**5 * scale))
+    rng = np.random.default_rng(seed)
+    u = rng.integers(1, n + 1, m)
+    v = rng.integers(1, n + 1, m)
+    if path:
+        u[:n - 1] = np.arange(1, n)
+        v[:n - 1] = np.arange(2, n + 1)
+        perm = rng.permutation(m)
+        u, v = u[perm], v[perm]
+    cols = [u, v]
+    if weighted:
+        cols.append(rng.integers(1, 10**9 + 1, m))
+    edges = np.column_stack(cols)
+    lines = "\n".join(" ".join(map(str, row)) for row in edges.tolist())
+    return f"{n} {m}\n{lines}\n".encode()
+
+
+# BASELINES - the textbook style: tuples, sets, deque, lists of lists
+
+def _grid_rows(data):
+    lines = data.split(b"\n")
+    n = int(lines[0].split()[0])
+    return [line.decode() for line in lines[1:n + 1]]
+
+
+def _adjacency(data, directed=False, weighted=False):
+    nums = list(map(int, data.split()))
+    n, m = nums[0], nums[1]
+    adj = [[] for _ in range(n + 1)]
+    step = 3 if weighted else 2
+    for k in range(2, 2 + step * m, step):
+        a, b = nums[k], nums[k + 1]
+        if weighted:
+            adj[a].append((b, nums[k + 2]))
+        else:
+            adj[a].append(b)
+            if not directed:
+                adj[b].append(a)
+    return n, adj
+
+
+def baseline_counting_rooms(data):
+    rows = _grid_rows(data)
+    n, m = len(rows), len(rows[0])
+    seen = set()
+    rooms = 0
+    for r in range(n):
+        for c in range(m):
+            if rows[r][c] == "." and (r, c) not in seen:
+                rooms += 1
+                seen.add((r, c))
+                queue = deque([(r, c)])
+                while queue:
+                    x, y = queue.popleft()
+                    for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                        nx, ny = x + dx, y + dy
+                        if 0 <= nx < n and 0 <= ny < m and rows[nx][ny] == "." \
+                                and (nx, ny) not in seen:
+                            seen.add((nx, ny))
+                            queue.append((nx, ny))
+    return rooms
+
+
+def baseline_labyrinth(data):
+    rows = _grid_rows(data)
+    n, m = len(rows), len(rows[0])
+    start = next((r, row.index("A")) for r, row in enumerate(rows) if "A" in row)
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if rows[x][y] == "B":
+            steps = 0
+            cell = (x, y)
+            while parent[cell] is not None:
+                cell = parent[cell]
+                steps += 1
+            return steps
+        for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < n and 0 <= ny < m and rows[nx][ny] != "#" \
+                    and (nx, ny) not in parent:
+                parent[(nx, ny)] = (x, y)
+                queue.append((nx, ny))
+    return -1
+
+
+def baseline_building_roads(data):
+    n, adj = _adjacency(data)
+    seen = [False] * (n + 1)
+    components = 0
+    for s in range(1, n + 1):
+        if seen[s]:
+            continue
+        components += 1
+        seen[s] = True
+        queue = deque([s])
+        while queue:
+            for v in adj[queue.popleft()]:
+                if not seen[v]:
+                    seen[v] = True
+                    queue.append(v)
+    return components - 1
+
+
+def baseline_message_route(data):
+    n, adj = _adjacency(data)
+    parent = [0] * (n + 1)
+    parent[1] = -1
+    queue = deque([1])
+    while queue:
+        u = queue.popleft()
+        for v in adj[u]:
+            if not parent[v]:
+                parent[v] = u
+                queue.append(v)
+    if not parent[n]:
+        return -1
+    length, v = 1, n
+    while parent[v] != -1:
+        v = parent[v]
+        length += 1
+    return length
+
+
+def baseline_shortest_routes(data):
+    n, adj = _adjacency(data, directed=True, weighted=True)
+    dist = [float('inf')] * (n + 1)
+    dist[1] = 0
+    pq = [(0, 1)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                heapq.heappush(pq, (d + w, v))
+    return sum(dist[1:])
+
+
+# ENGINES - the *_ref.py modules of this folder
+
+def _graph(data, directed=False, weighted=False):
+    nums = parse_ints(data)
+    return edges_from_ints(nums[2:], n=int(nums[0]), directed=directed,
+                           weighted=weighted, one_indexed=True)
+
+
+def grid_counting_rooms(data):
+    return Grid(_grid_rows(data)).components()[1]
+
+
+def grid_labyrinth_steps(data):
+    path = grid_labyrinth(_grid_rows(data))
+    return -1 if path is None else len(path)
+
+
+def dsu_building_roads(data):
+    nums = parse_ints(data)
+    n = int(nums[0])
+    edges = nums[2:].reshape(-1, 2) - 1
+    dsu = DSU(n)
+    dsu.union_many(edges[:, 0], edges[:, 1])
+    return dsu.components - 1
+
+
+def frontier_route(data):
+    route = frontier_message_route(_graph(data))
+    return -1 if route == "IMPOSSIBLE" else len(route)
+
+
+def bidirectional_route(data):
+    g = _graph(data)
+    path = BidirectionalBFS(g).shortest_path(0, g.n - 1)
+    return -1 if path is None else len(path)
+
+
+def csr_dijkstra(data):
+    return sum(dijkstra(_graph(data, directed=True, weighted=True), 0)[0])
+
+
+WORKLOADS = {
+    "counting_rooms": (gen_grid, {
+        "baseline": baseline_counting_rooms,
+        "grid_components": grid_counting_rooms,
+    }),
+    "labyrinth": (gen_labyrinth, {
+        "baseline": baseline_labyrinth,
+        "grid_bfs": grid_labyrinth_steps,
+    }),
+    "building_roads": (gen_graph, {
+        "baseline": baseline_building_roads,
+        "dsu_union_many": dsu_building_roads,
+    }),
+    "message_route": (gen_graph, {
+        "baseline": baseline_message_route,
+        "frontier_bfs": frontier_route,
+        "bidirectional_bfs": bidirectional_route,
+    }),
+    "shortest_routes": (lambda scale, seed: gen_graph(scale, seed, weighted=True, path=True), {
+        "baseline": baseline_shortest_routes,
+        "csr_dijkstra": csr_dijkstra,
+    }),
+}
+
+
+# MEASUREMENT
+def measure(solve, data, repeat=1):
+    """(answer, best seconds, peak bytes) for one implementation."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        t = time.perf_counter()
+        answer = solve(data)
+        best = min(best, time.perf_counter() - t)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        solve(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return answer, best, peak
+
+
+def run(names=None, scale=1.0, repeat=1, seed=0):
+    """Yield one record per (workload, implementation).
+
+    Raises AssertionError if implementations of a workload disagree.
+    """
+    for name in names or WORKLOADS:
+        generate, impls = WORKLOADS[name]
+        data = generate(scale, seed)
+        expected = None
+        for impl, solve in impls.items():
+            answer, seconds, peak = measure(solve, data, repeat)
+            if expected is None:
+                expected = answer
+            assert answer == expected, f"{name}/{impl}: {answer!r} != {expected!r}"
+            yield {"workload": name, "impl": impl, "seconds": seconds,
+                   "peak_mb": peak / 2**20, "input_mb": len(data) / 2**20,
+                   "answer": answer}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("workloads", nargs="*", metavar="workload",
+                        help=f"any of: {', '.join(WORKLOADS)} (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="input size vs CSES limits")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs, best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="one JSON record per line")
+    args = parser.parse_args()
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(sorted(unknown))}")
+
+    if not args.json:
+        print(f"{'workload':<16} {'impl':<18} {'time (s)':>9} {'peak MB':>9}  answer")
+    for rec in run(args.workloads, args.scale, args.repeat, args.seed):
+        if args.json:
+            print(json.dumps(rec), flush=True)
+        else:
+            print(f"{rec['workload']:<16} {rec['impl']:<18} {rec['seconds']:>9.3f} "
+                  f"{rec['peak_mb']:>9.1f}  {rec['answer']}", flush=True)
+
+# NOTE: peak memory is measured in its own run - tracemalloc slows code
+#       down 2-3x, so its timings are never reported
+# NOTE: the first implementation of each workload is the reference answer
+
+# TIME COMPLEXITY
+# generators: O(n + m); each solver is O(n + m) or O((n + m) log n)
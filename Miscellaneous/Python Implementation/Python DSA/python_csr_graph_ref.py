@@ -0,0 +1,202 @@
+"""
+CSR GRAPH (COMPRESSED SPARSE ROW)
+=================================
+Flat-array adjacency + fast edge-list loading
+"""
+
+import numpy as np
+
+# LAYOUT
+# indptr[u] .. indptr[u + 1]  -> slice of `indices` holding u's neighbors
+# indices  : all neighbor ids, grouped by source (int32)
+# weights  : optional, parallel to indices
+# edge_ids : input edge number of every slot (undirected edges appear twice)
+#
+# Memory per directed edge: 4 bytes + 4 edge id (+ weight if any)
+# vs dict / list-of-lists: ~36+ bytes per edge (pointer + int object)
+# plus a list object per node.
+#
+# Works with the dict-style templates (bfs, topological_sort, ...):
+# len(g), iteration over nodes and g[u] behave like a list of lists.
+
+
+def _bucket_order(keys, n):
+    # Stable order of keys in [0, n): LSD radix sort, 16 bits per pass.
+    # np.argsort(kind='stable') is a radix sort only for <= 16-bit ints
+    # (timsort, O(m log m), for int64), so sort uint16 digits, low first.
+    order = np.argsort(keys.astype(np.uint16), kind='stable')
+    for shift in range(16, max(n - 1, 0).bit_length(), 16):
+        digit = ((keys[order] >> shift) & 0xFFFF).astype(np.uint16)
+        order = order[np.argsort(digit, kind='stable')]
+    return order
+
+
+class CSRGraph:
+    def __init__(self, indptr, indices, weights=None, edge_ids=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.edge_ids = edge_ids
+        self.n = len(indptr) - 1
+
+    # BUILD FROM EDGE ARRAYS - bucket counts + radix sort by source, O(n + m)
+    @classmethod
+    def from_edges(cls, n, src, dst, weights=None, directed=True):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        m = len(src)
+        eid = np.arange(m, dtype=np.int32 if m < 1 << 31 else np.int64)
+        if not directed:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            eid = np.concatenate((eid, eid))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+        if m and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+            raise ValueError("node ids must be in [0, n)")
+
+        # Bucket sizes -> bucket starts; a stable radix sort by source then
+        # drops every edge into its bucket in input order
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        order = _bucket_order(src, n)
+
+        idx_dtype = np.int32 if n < 1 << 31 else np.int64
+        indices = dst[order].astype(idx_dtype)
+        if weights is not None:
+            weights = np.asarray(weights)[order]
+        return cls(indptr, indices, weights, eid[order])
+
+    @classmethod
+    def from_adjacency(cls, adj):
+        """From a list of lists or a dict {u: [v, ...]} with nodes 0..n-1."""
+        if isinstance(adj, dict):
+            n = max(max(adj, default=-1), max((v for vs in adj.values() for v in vs), default=-1)) + 1
+            rows = [adj.get(u, ()) for u in range(n)]
+        else:
+            n = len(adj)
+            rows = adj
+        deg = np.fromiter((len(r) for r in rows), dtype=np.int64, count=n)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(deg, out=indptr[1:])
+        indices = np.fromiter((v for r in rows for v in r), dtype=np.int32, count=int(indptr[-1]))
+        return cls(indptr, indices, None, np.arange(len(indices), dtype=np.int32))
+
+    # DICT / LIST-OF-LISTS PROTOCOL
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        return iter(range(self.n))
+
+    def __getitem__(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def neighbors(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def edge_weights(self, u):
+        return self.weights[self.indptr[u]:self.indptr[u + 1]]
+
+    # DEGREES / SIZE
+    @property
+    def num_edges(self):
+        return len(self.indices)  # directed slots (2x for undirected input)
+
+    def out_degree(self):
+        return np.diff(self.indptr)
+
+    def in_degree(self):
+        return np.bincount(self.indices, minlength=self.n)
+
+    def reverse(self):
+        """Transpose graph (every u -> v becomes v -> u)."""
+        src = np.repeat(np.arange(self.n, dtype=np.int64), self.out_degree())
+        g = CSRGraph.from_edges(self.n, self.indices, src, self.weights)
+        g.edge_ids = self.edge_ids[g.edge_ids]  # keep ids of the input edges
+        return g
+
+    def to_lists(self):
+        """Plain list-of-lists copy (Python ints) for tight pure-Python loops."""
+        flat = self.indices.tolist()
+        ptr = self.indptr.tolist()
+        return [flat[ptr[u]:ptr[u + 1]] for u in range(self.n)]
+
+    def nbytes(self):
+        arrays = (self.indptr, self.indices, self.weights, self.edge_ids)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+
+# FAST EDGE-LIST LOADER
+# np.fromstring(..., sep=' ') parses whitespace-separated ints in C:
+# no bytes.split() token objects, no int() per token.
+def parse_ints(data):
+    """All integers in a bytes buffer (any whitespace between them)."""
+    return np.fromstring(data, dtype=np.int64, sep=' ')
+
+
+def load_edge_list(data, n=None, directed=True, weighted=False,
+                   one_indexed=False, header=0):
+    """CSRGraph from raw bytes: `u v` or `u v w` per line.
+
+    header: number of leading integers to skip (e.g. 2 for a `n m` line).
+    """
+    return edges_from_ints(parse_ints(data)[header:], n, directed, weighted, one_indexed)
+
+
+def load_edge_file(path, block_size=1 << 26, n=None, directed=True,
+                   weighted=False, one_indexed=False, header=0):
+    """Same as load_edge_list, reading the file in blocks cut at line ends."""
+    parts = []
+    tail = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            parts.append(parse_ints(block[:cut]))
+    parts.append(parse_ints(tail))
+    nums = np.concatenate(parts)[header:]
+    return edges_from_ints(nums, n, directed, weighted, one_indexed)
+
+
+def edges_from_ints(nums, n=None, directed=True, weighted=False, one_indexed=False):
+    """CSRGraph from a flat int array u0 v0 [w0] u1 v1 [w1] ..."""
+    cols = 3 if weighted else 2
+    if len(nums) % cols:
+        raise ValueError(f"expected {cols} integers per edge, got {len(nums)} total")
+    nums = nums.reshape(-1, cols)
+    src, dst = nums[:, 0], nums[:, 1]
+    if one_indexed:
+        src, dst = src - 1, dst - 1
+    if n is None:
+        n = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+    weights = nums[:, 2] if weighted else None
+    return CSRGraph.from_edges(n, src, dst, weights, directed)
+
+
+# CP EXAMPLE - read "n m" then m edges, 1-indexed, undirected
+def read_graph():
+    import sys
+    nums = parse_ints(sys.stdin.buffer.read())
+    return edges_from_ints(nums[2:], n=int(nums[0]), directed=False, one_indexed=True)
+
+
+# USAGE
+# g = CSRGraph.from_edges(n, src, dst)                 # directed
+# g = CSRGraph.from_edges(n, u, v, w, directed=False)  # both directions
+# g = load_edge_list(open("edges.txt", "rb").read())
+# for v in g[u]: ...                                    # like adj[u]
+# bfs(g, 0); topological_sort(g, len(g))                # templates work as-is
+# adj = g.to_lists()                                    # when a loop needs ints
+
+# NOTE: g[u] is a NumPy view - iterate it for NumPy ints, or use
+#       to_lists() / indices.tolist() inside hot pure-Python loops
+# NOTE: CSR is static; rebuild (or keep an edge list) for updates
+
+# TIME COMPLEXITY
+# from_edges: O(n + m) buckets + O(m) per 16 bits of n (1 pass below 65536 nodes)
+# g[u]: O(1) view, degree queries O(n)
+# load_edge_list: O(bytes) in C
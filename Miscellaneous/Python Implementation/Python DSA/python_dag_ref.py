@@ -0,0 +1,192 @@
+"""
+DAG LEVELS & PARALLEL EXECUTION
+===============================
+Topological antichains, incremental ready sets, thread/process pool runner
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from graphlib import CycleError
+
+# GRAPH FORMAT (same as topological_sort in python_common_algos_ref.py)
+# graph = {u: [v, ...]}  means u must run BEFORE v
+# Nodes may be any hashable; nodes that only appear as targets are included.
+#
+# Flat order  : [a, b, c, d]          - hides what can run together
+# Levels      : [[a, b], [c], [d]]    - every level is an antichain
+# Ready sets  : hand out nodes the moment their last dependency finishes
+#               (better than levels when task durations differ)
+
+
+def _in_degrees(graph):
+    indeg = {}
+    for u, vs in graph.items():
+        indeg.setdefault(u, 0)
+        for v in vs:
+            indeg[v] = indeg.get(v, 0) + 1
+    return indeg
+
+
+# CYCLE DIAGNOSTICS - iterative DFS, returns one cycle [a, b, ..., a]
+def find_cycle(graph, nodes=None):
+    color = {}  # missing = white, 1 = on stack, 2 = done
+    for start in (nodes if nodes is not None else list(graph)):
+        if start in color:
+            continue
+        color[start] = 1
+        path = [start]
+        stack = [iter(graph.get(start, ()))]
+        while stack:
+            for v in stack[-1]:
+                c = color.get(v)
+                if c == 1:
+                    return path[path.index(v):] + [v]
+                if c is None:
+                    color[v] = 1
+                    path.append(v)
+                    stack.append(iter(graph.get(v, ())))
+                    break
+            else:
+                color[path.pop()] = 2
+                stack.pop()
+    return None
+
+
+def _raise_cycle(graph, indeg):
+    stuck = [u for u, d in indeg.items() if d > 0]
+    cycle = find_cycle(graph, stuck)
+    raise CycleError(f"graph has a cycle: {' -> '.join(map(str, cycle))}", cycle)
+
+
+# LEVEL-GROUPED TOPOLOGICAL SORT (Kahn, one level at a time)
+def topological_levels(graph):
+    """[[level 0 nodes], [level 1 nodes], ...]; raises CycleError on a cycle.
+
+    Level k = nodes whose longest dependency chain has k edges.
+    """
+    indeg = _in_degrees(graph)
+    level = [u for u, d in indeg.items() if d == 0]
+    levels = []
+    seen = 0
+    while level:
+        levels.append(level)
+        seen += len(level)
+        nxt = []
+        for u in level:
+            for v in graph.get(u, ()):
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    nxt.append(v)
+        level = nxt
+    if seen != len(indeg):
+        _raise_cycle(graph, indeg)
+    return levels
+
+
+# INCREMENTAL READY SETS
+class ReadyQueue:
+    """Hand out runnable nodes as their dependencies complete.
+
+    q = ReadyQueue(graph)
+    while q.is_active():
+        for node in q.get_ready(): start(node)
+        q.done(finished_node)
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.indeg = _in_degrees(graph)
+        self._ready = deque(u for u, d in self.indeg.items() if d == 0)
+        self._remaining = len(self.indeg)
+        self._running = 0
+        if not self._ready and self._remaining:
+            _raise_cycle(graph, dict(self.indeg))
+
+    def get_ready(self):
+        ready = list(self._ready)
+        self._ready.clear()
+        self._running += len(ready)
+        return ready
+
+    def done(self, *nodes):
+        indeg = self.indeg
+        for u in nodes:
+            self._running -= 1
+            self._remaining -= 1
+            for v in self.graph.get(u, ()):
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    self._ready.append(v)
+        if not self._ready and not self._running and self._remaining:
+            # Nothing runnable, nothing running, work left -> cycle
+            _raise_cycle(self.graph, {u: d for u, d in indeg.items() if d > 0})
+
+    def is_active(self):
+        return self._remaining > 0
+
+
+# PARALLEL DAG EXECUTOR
+def run_dag(graph, task, max_workers=None, processes=False, executor=None):
+    """Run task(node) for every node, each after all of its dependencies.
+
+    task: callable(node) or dict {node: zero-arg callable}
+    processes: use a process pool (task and results must be picklable)
+    Returns {node: result}. The first failing task's exception is re-raised
+    after the in-flight tasks finish; nothing new is started after a failure.
+    """
+    if isinstance(task, dict):
+        calls = task
+        task = None
+    queue = ReadyQueue(graph)
+    results = {}
+    own = executor is None
+    if own:
+        pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        executor = pool_cls(max_workers=max_workers)
+    try:
+        running = {}
+        error = None
+        while queue.is_active() and error is None:
+            for node in queue.get_ready():
+                fut = executor.submit(calls[node]) if task is None else executor.submit(task, node)
+                running[fut] = node
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                node = running.pop(fut)
+                exc = fut.exception()
+                if exc is not None:
+                    error = error or exc
+                    continue
+                results[node] = fut.result()
+                queue.done(node)
+        if running:
+            wait(running)
+        if error is not None:
+            raise error
+        return results
+    finally:
+        if own:
+            executor.shutdown(wait=True)
+
+
+# USAGE
+# graph = {"fetch": ["build"], "gen": ["build"], "build": ["test", "docs"]}
+# topological_levels(graph)   # [['fetch', 'gen'], ['build'], ['test', 'docs']]
+# run_dag(graph, lambda name: do(name), max_workers=8)
+# run_dag(graph, {"fetch": fetch, "gen": gen, ...})         # per-node callables
+# run_dag(graph, compile_unit, processes=True)              # CPU-bound work
+#
+# try:
+#     topological_levels({1: [2], 2: [1]})
+# except CycleError as e:
+#     e.args[1]               # [1, 2, 1]
+
+# NOTE: CycleError is graphlib's (a ValueError), same as graphlib.TopologicalSorter
+# NOTE: with processes=True, task must be a module-level function
+
+# TIME COMPLEXITY
+# topological_levels / ReadyQueue: O(V + E)
+# find_cycle: O(V + E)
+# run_dag: O(V + E) scheduling + the tasks themselves
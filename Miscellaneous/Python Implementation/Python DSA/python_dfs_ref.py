@@ -0,0 +1,248 @@
+"""
+ITERATIVE DFS TOOLKIT
+=====================
+Explicit-stack DFS over CSRGraph: orders, Tarjan SCC, bridges, articulation points, cycles
+"""
+
+from array import array
+
+# WHY?
+# Recursive DFS dies at ~1000 frames (RecursionError), and raising
+# sys.setrecursionlimit just trades that for a C-stack segfault near 10^5.
+#
+# Explicit stack pattern used everywhere below:
+#   stack = [u]            nodes whose adjacency is still being scanned
+#   it[u]                  next CSR slot of u to look at
+#   top = stack[-1]; if it[top] < end(top): take one edge, maybe push
+#                    else: u is finished -> "post" work, pop
+# One array read per edge, no generator / tuple per frame.
+#
+# Input: CSRGraph (python_csr_graph_ref.py). Undirected algorithms expect
+# CSRGraph.from_edges(..., directed=False) so each edge keeps one edge id.
+
+
+def _csr(graph):
+    return memoryview(graph.indptr), memoryview(graph.indices)
+
+
+# PRE / POST ORDER (+ DFS tree parents)
+def dfs_order(graph, sources=None):
+    """Returns (preorder, postorder, parent); parent = -1 for roots."""
+    ptr, adj = _csr(graph)
+    n = graph.n
+    it = array('q', ptr[:n])
+    parent = array('i', [-1]) * n
+    seen = bytearray(n)
+    pre, post = [], []
+    for s in (range(n) if sources is None else sources):
+        if seen[s]:
+            continue
+        seen[s] = 1
+        pre.append(s)
+        stack = [s]
+        while stack:
+            u = stack[-1]
+            k = it[u]
+            if k < ptr[u + 1]:
+                it[u] = k + 1
+                v = adj[k]
+                if not seen[v]:
+                    seen[v] = 1
+                    parent[v] = u
+                    pre.append(v)
+                    stack.append(v)
+            else:
+                post.append(stack.pop())
+    return pre, post, parent
+
+
+# TARJAN SCC - iterative
+def tarjan_scc(graph):
+    """Returns (comp, count). comp[v] in 0..count-1; components come out in
+    reverse topological order (comp 0 has no edges to other components)."""
+    ptr, adj = _csr(graph)
+    n = graph.n
+    it = array('q', ptr[:n])
+    index = array('i', [-1]) * n
+    low = array('i', bytes(4 * n))
+    comp = array('i', [-1]) * n
+    on_stack = bytearray(n)
+    scc_stack = []
+    t = 0
+    count = 0
+    for s in range(n):
+        if index[s] >= 0:
+            continue
+        index[s] = low[s] = t
+        t += 1
+        scc_stack.append(s)
+        on_stack[s] = 1
+        stack = [s]
+        while stack:
+            u = stack[-1]
+            k = it[u]
+            if k < ptr[u + 1]:
+                it[u] = k + 1
+                v = adj[k]
+                if index[v] < 0:
+                    index[v] = low[v] = t
+                    t += 1
+                    scc_stack.append(v)
+                    on_stack[v] = 1
+                    stack.append(v)
+                elif on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                stack.pop()
+                if stack:
+                    p = stack[-1]
+                    if low[u] < low[p]:
+                        low[p] = low[u]
+                if low[u] == index[u]:
+                    while True:  # u is the root of a component
+                        w = scc_stack.pop()
+                        on_stack[w] = 0
+                        comp[w] = count
+                        if w == u:
+                            break
+                    count += 1
+    return comp, count
+
+
+# BRIDGES & ARTICULATION POINTS (undirected) - one pass, low-link values
+# The parent edge is skipped by EDGE ID, not by node, so parallel edges
+# between the same pair are correctly never bridges.
+def bridges_and_articulation_points(graph):
+    """Returns (bridge edge ids, articulation point nodes)."""
+    ptr, adj = _csr(graph)
+    eid = memoryview(graph.edge_ids)
+    n = graph.n
+    it = array('q', ptr[:n])
+    tin = array('i', [-1]) * n
+    low = array('i', bytes(4 * n))
+    parent_edge = array('q', [-1]) * n
+    is_cut = bytearray(n)
+    bridges = []
+    t = 0
+    for s in range(n):
+        if tin[s] >= 0:
+            continue
+        tin[s] = low[s] = t
+        t += 1
+        root_children = 0
+        stack = [s]
+        while stack:
+            u = stack[-1]
+            k = it[u]
+            if k < ptr[u + 1]:
+                it[u] = k + 1
+                e = eid[k]
+                if e == parent_edge[u]:
+                    continue
+                v = adj[k]
+                if tin[v] < 0:
+                    tin[v] = low[v] = t
+                    t += 1
+                    parent_edge[v] = e
+                    stack.append(v)
+                    if u == s:
+                        root_children += 1
+                elif tin[v] < low[u]:
+                    low[u] = tin[v]
+            else:
+                stack.pop()
+                if stack:
+                    p = stack[-1]
+                    if low[u] < low[p]:
+                        low[p] = low[u]
+                    if low[u] > tin[p]:
+                        bridges.append(parent_edge[u])
+                    if low[u] >= tin[p] and p != s:
+                        is_cut[p] = 1
+        if root_children >= 2:
+            is_cut[s] = 1
+    return bridges, [v for v in range(n) if is_cut[v]]
+
+
+def bridges(graph):
+    return bridges_and_articulation_points(graph)[0]
+
+
+def articulation_points(graph):
+    return bridges_and_articulation_points(graph)[1]
+
+
+# CYCLE DETECTION - returns one cycle as [v0, v1, ..., v0] or None
+# directed: an edge to a node still on the stack (gray) closes a cycle
+# undirected: any non-tree edge closes one (parent edge skipped by id)
+def find_cycle(graph, directed=True):
+    ptr, adj = _csr(graph)
+    eid = memoryview(graph.edge_ids) if not directed else None
+    n = graph.n
+    it = array('q', ptr[:n])
+    color = bytearray(n)  # 0 white, 1 on stack, 2 done
+    parent = array('i', [-1]) * n
+    parent_edge = array('q', [-1]) * n
+    for s in range(n):
+        if color[s]:
+            continue
+        color[s] = 1
+        stack = [s]
+        while stack:
+            u = stack[-1]
+            k = it[u]
+            if k < ptr[u + 1]:
+                it[u] = k + 1
+                if not directed and eid[k] == parent_edge[u]:
+                    continue
+                v = adj[k]
+                if color[v] == 0:
+                    color[v] = 1
+                    parent[v] = u
+                    if not directed:
+                        parent_edge[v] = eid[k]
+                    stack.append(v)
+                elif color[v] == 1:
+                    cycle = [u]
+                    while cycle[-1] != v:
+                        cycle.append(parent[cycle[-1]])
+                    cycle.reverse()
+                    return cycle + [v]
+            else:
+                color[u] = 2
+                stack.pop()
+    return None
+
+
+def has_cycle(graph, directed=True):
+    return find_cycle(graph, directed) is not None
+
+
+# CP EXAMPLES
+
+# Flight Routes Check (CSES): strongly connected?
+def is_strongly_connected(graph):
+    return tarjan_scc(graph)[1] <= 1
+
+# Round Trip II (CSES): directed cycle, 1-indexed
+def round_trip(graph):
+    cycle = find_cycle(graph, directed=True)
+    return [v + 1 for v in cycle] if cycle else "IMPOSSIBLE"
+
+
+# USAGE
+# g = CSRGraph.from_edges(n, u, v)                    # directed
+# comp, k = tarjan_scc(g)
+# pre, post, parent = dfs_order(g, sources=[0])
+# find_cycle(g)                                       # [a, b, c, a] or None
+#
+# ug = CSRGraph.from_edges(n, u, v, directed=False)   # undirected
+# bridges(ug)                                         # input edge indices
+# articulation_points(ug)                             # node ids
+
+# NOTE: reverse(postorder) of a DAG is a topological order
+# NOTE: a path of 10^6 nodes works - the only "stack" is a Python list
+
+# TIME COMPLEXITY
+# every function: O(V + E)
+# Memory: a few int arrays of size V, stack <= V entries
@@ -0,0 +1,177 @@
+"""
+DIGIT DP
+========
+Count / generate numbers in [lo, hi] whose digits satisfy a rule
+"""
+
+# WHY?
+# Brute force: for x in range(A, B + 1): check(str(x))  -> O(B - A)
+# Digit DP walks the digits of the bound instead:
+#   count:    O(digits * states * 10)
+#   generate: O(output * digits), empty branches are pruned by the counts
+#
+# A rule is a small automaton over the digits (most significant first):
+#   init            -> starting state
+#   step(state, d)  -> next state, or None to reject digit d
+#   accept(state)   -> does a finished number in this state count?
+# States must be hashable (they are memoized).
+
+
+class DigitDP:
+    def __init__(self, init, step, accept=lambda state: True):
+        self.init = init
+        self.step = step
+        self.accept = accept
+        self._memo = {}
+
+    # free(rem, state): ways to append `rem` unconstrained digits and accept
+    def _free(self, rem, state):
+        key = (rem, state)
+        memo = self._memo
+        if key in memo:
+            return memo[key]
+        if rem == 0:
+            res = 1 if self.accept(state) else 0
+        else:
+            res = 0
+            step = self.step
+            for d in range(10):
+                nxt = step(state, d)
+                if nxt is not None:
+                    res += self._free(rem - 1, nxt)
+        memo[key] = res
+        return res
+
+    def _zero_ok(self):
+        nxt = self.step(self.init, 0)
+        return nxt is not None and self.accept(nxt)
+
+    # COUNT in [0, n]
+    def count_upto(self, n):
+        if n < 0:
+            return 0
+        total = 1 if self._zero_ok() else 0
+        if n == 0:
+            return total  # the walk below would count 0 a second time
+        digits = list(map(int, str(n)))
+        length = len(digits)
+        step = self.step
+
+        # Shorter numbers: any first digit 1..9, rest free
+        for l in range(1, length):
+            for d in range(1, 10):
+                nxt = step(self.init, d)
+                if nxt is not None:
+                    total += self._free(l - 1, nxt)
+
+        # Same length: walk the tight prefix of n
+        state = self.init
+        for i, limit in enumerate(digits):
+            for d in range(1 if i == 0 else 0, limit):
+                nxt = step(state, d)
+                if nxt is not None:
+                    total += self._free(length - i - 1, nxt)
+            state = step(state, limit)
+            if state is None:
+                return total
+        if self.accept(state):
+            total += 1  # n itself
+        return total
+
+    def count(self, lo, hi):
+        if lo > hi:
+            return 0
+        return self.count_upto(hi) - self.count_upto(lo - 1)
+
+    # GENERATE all matches in [lo, hi], ascending
+    def generate(self, lo, hi):
+        lo = max(lo, 0)
+        if lo > hi:
+            return
+        if lo == 0:
+            if self._zero_ok():
+                yield 0
+            lo = 1
+            if lo > hi:
+                return
+        for length in range(len(str(lo)), len(str(hi)) + 1):
+            low = list(map(int, str(lo))) if length == len(str(lo)) else None
+            high = list(map(int, str(hi))) if length == len(str(hi)) else None
+            yield from self._gen(length, 0, self.init, 0, low, high)
+
+    def _gen(self, length, pos, state, value, low, high):
+        # low / high are the bound digits while still tight, else None
+        if pos == length:
+            if self.accept(state):
+                yield value
+            return
+        rem = length - pos - 1
+        first = low[pos] if low is not None else (1 if pos == 0 else 0)
+        last = high[pos] if high is not None else 9
+        step = self.step
+        for d in range(first, last + 1):
+            nxt = step(state, d)
+            if nxt is None:
+                continue
+            nlow = low if low is not None and d == low[pos] else None
+            nhigh = high if high is not None and d == high[pos] else None
+            if nlow is None and nhigh is None and self._free(rem, nxt) == 0:
+                continue  # nothing below this branch: prune
+            yield from self._gen(length, pos + 1, nxt, value * 10 + d, nlow, nhigh)
+
+
+# COMMON RULES
+def digit_rule(allowed=None, digit_sum=None, divisor=None, remainder=0):
+    """DigitDP for: digits in `allowed`, digit sum == `digit_sum`,
+    number % divisor == remainder. Any subset of the three may be given."""
+    allowed = frozenset(allowed) if allowed is not None else None
+
+    def step(state, d):
+        s, r = state
+        if allowed is not None and d not in allowed:
+            return None
+        if digit_sum is not None:
+            s += d
+            if s > digit_sum:
+                return None
+        if divisor is not None:
+            r = (r * 10 + d) % divisor
+        return s, r
+
+    def accept(state):
+        s, r = state
+        if digit_sum is not None and s != digit_sum:
+            return False
+        return divisor is None or r == remainder % divisor
+
+    return DigitDP((0, 0), step, accept)
+
+
+# CP EXAMPLES
+
+# Lucky Numbers (digits only 4 and 7) in [A, B]
+def lucky_numbers(a, b):
+    return list(digit_rule(allowed={4, 7}).generate(a, b))
+
+# How many numbers in [A, B] have digit sum S?
+def count_digit_sum(a, b, s):
+    return digit_rule(digit_sum=s).count(a, b)
+
+# Numbers in [A, B] divisible by K using only even digits
+def count_even_digit_multiples(a, b, k):
+    return digit_rule(allowed={0, 2, 4, 6, 8}, divisor=k).count(a, b)
+
+
+# USAGE
+# lucky_numbers(1, 100)                        # [4, 7, 44, 47, 74, 77]
+# lucky_numbers(1, 10**18)                     # 524286 numbers, no scan
+# count_digit_sum(1, 10**18, 100)              # instant
+# dp = DigitDP(init, step, accept)             # any custom automaton
+# next(dp.generate(10**17, 10**18), None)      # first match only
+
+# NOTE: build one DigitDP per rule and reuse it - the memo is shared
+# NOTE: state space should stay small (sums, remainders, flags)
+
+# TIME COMPLEXITY
+# count: O(digits * states * 10), memo reused across queries
+# generate: O(output * digits + digits^2 * 10)
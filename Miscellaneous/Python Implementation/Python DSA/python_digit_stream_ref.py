@@ -0,0 +1,128 @@
+"""
+STREAMING DIGIT STATISTICS
+==========================
+Digit sum / histogram / mod 9 / mod 11 of huge numbers in O(1) memory
+"""
+
+import sys
+
+# WHY?
+# sum(map(int, input()))  -> one int object per character + the whole line
+# Reading sys.stdin.buffer in fixed chunks and counting bytes in C:
+#   memory O(chunk), ~10 bytes.count() calls per chunk, no per-digit objects
+#
+# Facts used:
+# digit_sum(x) = sum(d * count[d])
+# x mod 9  = digit_sum mod 9
+# x mod 11 = alternating digit sum from the RIGHT mod 11
+#   from the left we track even - odd positions, then fix the sign at the end
+
+DIGITS = b"0123456789"
+_NON_DIGITS = bytes(c for c in range(256) if c not in DIGITS)
+
+
+class DigitStats:
+    """Feed chunks of ASCII digits with update(); non-digit bytes are skipped."""
+
+    def __init__(self):
+        self.counts = [0] * 10
+        self.length = 0
+        self._alt = 0  # sum(d at even index) - sum(d at odd index), from left
+
+    def update(self, chunk):
+        chunk = chunk.translate(None, _NON_DIGITS)
+        if not chunk:
+            return
+        even = chunk[0::2]
+        odd = chunk[1::2]
+        alt = 0
+        nonzero = 0
+        counts = self.counts
+        for d in range(1, 10):
+            ce = even.count(DIGITS[d:d + 1])
+            co = odd.count(DIGITS[d:d + 1])
+            counts[d] += ce + co
+            nonzero += ce + co
+            alt += d * (ce - co)
+        counts[0] += len(chunk) - nonzero
+        # Chunk starts at an odd global index -> its parities are swapped
+        self._alt += -alt if self.length & 1 else alt
+        self.length += len(chunk)
+
+    @property
+    def digit_sum(self):
+        return sum(d * c for d, c in enumerate(self.counts))
+
+    @property
+    def mod9(self):
+        return self.digit_sum % 9
+
+    @property
+    def mod11(self):
+        # Last digit has index length - 1; it must get the + sign
+        alt = self._alt if (self.length - 1) % 2 == 0 else -self._alt
+        return alt % 11
+
+    def histogram(self):
+        return dict(zip(range(10), self.counts))
+
+
+def stream_digit_stats(stream=None, chunk_size=1 << 20):
+    """Consume a binary stream (default: sys.stdin.buffer) chunk by chunk."""
+    if stream is None:
+        stream = sys.stdin.buffer
+    stats = DigitStats()
+    read = stream.read
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        stats.update(chunk)
+    return stats
+
+
+# NUMPY VARIANT - bincount on a zero-copy view of each chunk
+def stream_digit_stats_np(stream=None, chunk_size=1 << 22):
+    import numpy as np
+
+    if stream is None:
+        stream = sys.stdin.buffer
+    stats = DigitStats()
+    weights = np.arange(10, dtype=np.int64)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        d = np.frombuffer(chunk, dtype=np.uint8) - np.uint8(48)
+        d = d[d < 10]  # wraps below '0', so one compare drops all non-digits
+        if not d.size:
+            continue
+        hist_even = np.bincount(d[0::2], minlength=10)
+        hist_odd = np.bincount(d[1::2], minlength=10)
+        for i in range(10):
+            stats.counts[i] += int(hist_even[i] + hist_odd[i])
+        alt = int(weights @ (hist_even - hist_odd))
+        stats._alt += -alt if stats.length & 1 else alt
+        stats.length += int(d.size)
+    return stats
+
+
+# CP EXAMPLE - K. Sum Digits (first line N, second line the digits)
+def sum_digits_main():
+    stream = sys.stdin.buffer
+    stream.readline()  # N, not needed
+    print(stream_digit_stats(stream).digit_sum)
+
+
+# USAGE
+# stats = stream_digit_stats()              # whole stdin
+# stats.digit_sum, stats.mod9, stats.mod11
+# stats.histogram()                         # {0: c0, 1: c1, ...}
+# with open("big.txt", "rb") as f:
+#     stats = stream_digit_stats_np(f)
+
+# NOTE: every non-digit byte (newline, spaces, sign) is ignored,
+#       so the whole stream is treated as ONE number
+
+# TIME COMPLEXITY
+# O(n) bytes scanned in C, O(chunk_size) memory
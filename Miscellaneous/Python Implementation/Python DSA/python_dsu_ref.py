@@ -0,0 +1,130 @@
+"""
+DISJOINT SET UNION (ARRAY-BACKED)
+=================================
+Iterative find, union by size, path halving, batch unions
+"""
+
+from array import array
+
+# WHY NOT THE UnionFind IN python_common_algos_ref.py?
+# - recursive find -> RecursionError on a long chain (before compression helps)
+# - parent / rank are lists of int objects: 8-byte pointer + 28-byte int
+#   each, ~440 MB for 10^7 nodes
+# array('i') stores raw 4-byte ints: parent + size = 80 MB for 10^7 nodes
+#
+# Encoding: parent[x] = x for roots; size[root] = component size
+# Path halving: x -> grandparent while walking up (one pass, no stack)
+
+
+class DSU:
+    def __init__(self, n):
+        self.n = n
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.components = n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        size = self.size
+        if size[x] < size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        size[x] += size[y]
+        self.components -= 1
+        return True
+
+    def same(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    # BATCH UNION - find inlined, attributes hoisted into locals
+    def union_many(self, edges_u, edges_v):
+        """Union every (edges_u[i], edges_v[i]); returns how many merged."""
+        parent = self.parent
+        size = self.size
+        merged = 0
+        if hasattr(edges_u, "tolist"):  # NumPy: iterate Python ints, not scalars
+            edges_u = edges_u.tolist()
+            edges_v = edges_v.tolist()
+        for x, y in zip(edges_u, edges_v):
+            while parent[x] != x:
+                parent[x] = x = parent[parent[x]]
+            while parent[y] != y:
+                parent[y] = y = parent[parent[y]]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged += 1
+        self.components -= merged
+        return merged
+
+    # COMPONENT LABELS 0..k-1 (in order of first appearance)
+    def labels(self):
+        n = self.n
+        parent = self.parent
+        root_label = array('i', [-1]) * n
+        out = array('i', bytes(4 * n))
+        k = 0
+        for x in range(n):
+            r = x
+            while parent[r] != r:
+                parent[r] = r = parent[parent[r]]
+            lab = root_label[r]
+            if lab < 0:
+                lab = root_label[r] = k
+                k += 1
+            out[x] = lab
+        return out
+
+    def groups(self):
+        res = {}
+        for x, lab in enumerate(self.labels()):
+            res.setdefault(lab, []).append(x)
+        return list(res.values())
+
+
+# CP EXAMPLES
+
+# Number of connected components
+def count_components(n, edges):
+    dsu = DSU(n)
+    dsu.union_many([u for u, _ in edges], [v for _, v in edges])
+    return dsu.components
+
+# Redundant connection (first edge closing a cycle)
+def find_redundant(edges):
+    dsu = DSU(len(edges) + 1)
+    for u, v in edges:
+        if not dsu.union(u, v):
+            return [u, v]
+    return []
+
+
+# USAGE
+# dsu = DSU(10**7)
+# dsu.union_many(us, vs)        # lists, arrays or NumPy arrays
+# dsu.components                # number of sets
+# labels = dsu.labels()         # array('i'), np.frombuffer(labels, np.int32)
+
+# NOTE: the loop in union_many writes `parent[x] = x = parent[parent[x]]`,
+#       i.e. assign parent[x] FIRST, then x (chained assignment is left to right)
+# NOTE: array('i') caps n at 2^31 - 1
+
+# TIME COMPLEXITY
+# find / union: O(alpha(n)) amortized
+# union_many: O(m * alpha(n))
+# labels: O(n * alpha(n))
@@ -0,0 +1,179 @@
+"""
+ROLLBACK DSU & OFFLINE DYNAMIC CONNECTIVITY
+============================================
+Union-find with undo + segment tree over time for edge add / remove
+"""
+
+from array import array
+
+# ROLLBACK DSU
+# Path compression rewrites many parents -> impossible to undo cheaply.
+# Union by rank alone keeps find at O(log n), and every union changes
+# exactly one parent (+ maybe one rank), so undo = pop one history entry.
+
+
+class RollbackDSU:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.rank = array('b', bytes(n))
+        self.components = n
+        self._history = []  # child root per union, ~root if rank bumped, None = no-op
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            self._history.append(None)  # keep one entry per call
+            return False
+        rank = self.rank
+        if rank[x] < rank[y]:
+            x, y = y, x
+        self.parent[y] = x
+        if rank[x] == rank[y]:
+            rank[x] += 1
+            self._history.append(~y)  # negative = rank of x was bumped
+        else:
+            self._history.append(y)
+        self.components -= 1
+        return True
+
+    def same(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def snapshot(self):
+        return len(self._history)
+
+    def rollback(self, snap=None):
+        """Undo unions back to `snap` (default: undo the last union)."""
+        history = self._history
+        if snap is None:
+            snap = len(history) - 1
+        parent = self.parent
+        while len(history) > snap:
+            y = history.pop()
+            if y is None:
+                continue
+            if y < 0:
+                y = ~y
+                self.rank[parent[y]] -= 1
+            parent[y] = y
+            self.components += 1
+
+
+# OFFLINE DYNAMIC CONNECTIVITY
+# Every edge is alive on a range of query indices [l, r).
+# Put each edge into the O(log q) segment tree nodes covering its range;
+# DFS the tree: union on enter, answer queries at leaves, rollback on exit.
+# Total: O((m log q + q) log n)
+
+
+class DynamicConnectivity:
+    """Record events in time order, then solve() answers all queries."""
+
+    def __init__(self, n):
+        self.n = n
+        self._open = {}      # (u, v) -> stack of query indices when added
+        self._intervals = []  # (l, r, u, v)
+        self._queries = []    # (u, v), or None for a component count
+
+    @staticmethod
+    def _key(u, v):
+        return (u, v) if u <= v else (v, u)
+
+    def add_edge(self, u, v):
+        self._open.setdefault(self._key(u, v), []).append(len(self._queries))
+
+    def remove_edge(self, u, v):
+        key = self._key(u, v)
+        starts = self._open.get(key)
+        if not starts:
+            raise KeyError(f"edge {key} is not present")
+        l = starts.pop()
+        if l < len(self._queries):
+            self._intervals.append((l, len(self._queries), key[0], key[1]))
+
+    def connected(self, u, v):
+        """Ask 'are u and v connected now?'; returns the query index."""
+        self._queries.append((u, v))
+        return len(self._queries) - 1
+
+    def count_components(self):
+        self._queries.append(None)
+        return len(self._queries) - 1
+
+    def solve(self):
+        q = len(self._queries)
+        if q == 0:
+            return []
+        intervals = list(self._intervals)
+        for (u, v), starts in self._open.items():
+            for l in starts:
+                if l < q:
+                    intervals.append((l, q, u, v))  # never removed
+
+        size = 1
+        while size < q:
+            size <<= 1
+        node_edges = [[] for _ in range(2 * size)]
+        for l, r, u, v in intervals:
+            # Iterative bottom-up segment tree cover of [l, r)
+            l += size
+            r += size
+            while l < r:
+                if l & 1:
+                    node_edges[l].append((u, v))
+                    l += 1
+                if r & 1:
+                    r -= 1
+                    node_edges[r].append((u, v))
+                l >>= 1
+                r >>= 1
+
+        dsu = RollbackDSU(self.n)
+        answers = [None] * q
+        queries = self._queries
+        # Explicit stack: (node, first leaf, width, snapshot);
+        # snapshot -1 means "entering", otherwise "leaving: roll back to it"
+        stack = [(1, 0, size, -1)]
+        while stack:
+            node, lo, width, snap = stack.pop()
+            if snap >= 0:
+                dsu.rollback(snap)
+                continue
+            stack.append((node, lo, width, dsu.snapshot()))
+            for u, v in node_edges[node]:
+                dsu.union(u, v)
+            if width == 1:
+                query = queries[lo]
+                if query is None:
+                    answers[lo] = dsu.components
+                else:
+                    answers[lo] = dsu.same(query[0], query[1])
+                continue
+            half = width >> 1
+            if lo + half < q:  # padding leaves hold no queries
+                stack.append((2 * node + 1, lo + half, half, -1))
+            stack.append((2 * node, lo, half, -1))
+        return answers
+
+
+# USAGE
+# dc = DynamicConnectivity(4)
+# dc.add_edge(0, 1)
+# q0 = dc.connected(0, 1)       # True
+# dc.remove_edge(0, 1)
+# q1 = dc.connected(0, 1)       # False
+# q2 = dc.count_components()    # 4
+# dc.solve()                    # [True, False, 4]
+
+# NOTE: duplicate edges are fine - each add needs its own remove
+# NOTE: RollbackDSU has no path compression on purpose (undo must be O(1))
+
+# TIME COMPLEXITY
+# RollbackDSU find: O(log n), union: O(log n), rollback: O(1) per union
+# DynamicConnectivity.solve: O((m log q + q) log n), m = edge additions
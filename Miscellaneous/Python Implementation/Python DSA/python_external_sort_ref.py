@@ -0,0 +1,269 @@
+"""
+EXTERNAL MERGE SORT
+===================
+Sort int / line files larger than memory: sorted runs on disk + k-way merge
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# WHY?
+# heapq.merge (python_heap_ref.py, "MERGE SORTED") needs the inputs to be
+# sorted already and usually in memory. For a multi-GB file:
+#   1. runs    read a chunk that fits in RAM, sort it, write it to a temp
+#              file (binary for ints, one line per row for text)
+#              -> independent chunks, so worker processes can sort them
+#   2. merge   stream all runs at once through a k-way merge, reading
+#              each with a large buffer (few syscalls, sequential I/O)
+#
+# Int merge, block-wise instead of one heap pop per value:
+#   every run keeps a buffer of B sorted values
+#   bound = min over runs of (last value in buffer)
+#   everything <= bound, from every buffer, is final -> emit it in one
+#   np.sort of the concatenated prefixes; refill the buffers that ran dry
+#
+# Results are a streaming iterator: sorted NumPy blocks (ints) or lines.
+
+RUN_ITEMS = 1 << 24   # ints per run: 128 MB as int64
+RUN_BYTES = 1 << 27   # text bytes per run (lines cost ~3x that in RAM)
+READ_BUFFER = 1 << 20
+
+
+def _new_run(tmp, i):
+    return os.path.join(tmp, f"run{i:05d}.bin")
+
+
+# RUN BUILDERS - module level so worker processes can call them
+def _sort_int_range(src, dtype, start, count, dst, unique):
+    itemsize = np.dtype(dtype).itemsize
+    a = np.fromfile(src, dtype=dtype, count=count, offset=start * itemsize)
+    a = np.unique(a) if unique else np.sort(a)
+    a.tofile(dst)
+    return dst
+
+
+def _sort_line_range(src, start, end, dst, unique):
+    with open(src, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = data.split(b"\n")
+    if lines and lines[-1] == b"":
+        lines.pop()
+    lines = sorted(set(lines)) if unique else sorted(lines)
+    with open(dst, "wb") as out:
+        if lines:
+            out.write(b"\n".join(lines))
+            out.write(b"\n")
+    return dst
+
+
+def _run_jobs(fn, jobs, workers):
+    if workers and len(jobs) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(fn, *zip(*jobs)))
+    return [fn(*job) for job in jobs]
+
+
+# K-WAY MERGES
+def _merge_int_runs(paths, dtype, unique, buffer_items):
+    files = [open(p, "rb") for p in paths]
+    try:
+        bufs, live = [], []
+        for f in files:
+            b = np.fromfile(f, dtype=dtype, count=buffer_items)
+            if len(b):
+                bufs.append(b)
+                live.append(f)
+        last = None
+        while bufs:
+            bound = min(b[-1] for b in bufs)
+            parts = []
+            nxt_bufs, nxt_live = [], []
+            for b, f in zip(bufs, live):
+                cut = np.searchsorted(b, bound, side='right')
+                parts.append(b[:cut])
+                b = b[cut:]
+                if len(b) == 0:
+                    b = np.fromfile(f, dtype=dtype, count=buffer_items)
+                    if len(b) == 0:
+                        continue  # run exhausted
+                nxt_bufs.append(b)
+                nxt_live.append(f)
+            bufs, live = nxt_bufs, nxt_live
+            out = np.concatenate(parts)
+            if unique:
+                out = np.unique(out)
+                if last is not None and len(out) and out[0] == last:
+                    out = out[1:]
+            else:
+                out.sort()
+            if len(out):
+                last = out[-1]
+                yield out
+    finally:
+        for f in files:
+            f.close()
+
+
+def _merge_line_runs(paths, unique):
+    files = [open(p, "rb", buffering=READ_BUFFER) for p in paths]
+    try:
+        # Compare WITHOUT the newline, like the runs were sorted: b"\t" < b"\n"
+        # would otherwise put b"a\tb" and b"a" in different orders
+        prev = None
+        for line in heapq.merge(*((row[:-1] for row in f) for f in files)):
+            if unique and line == prev:
+                continue
+            prev = line
+            yield line
+    finally:
+        for f in files:
+            f.close()
+
+
+# INTS - binary file of `dtype` values (e.g. written with ndarray.tofile)
+def sort_int_file(path, dtype=np.int64, run_items=RUN_ITEMS, workers=0,
+                  unique=False, tmp_dir=None, buffer_bytes=1 << 26):
+    """Yield the file's values in ascending order as sorted NumPy blocks.
+
+    workers: sort runs in that many processes (0 = in this process).
+    unique: drop duplicates. Temp runs are deleted when the iterator ends.
+    """
+    total = os.path.getsize(path) // np.dtype(dtype).itemsize
+    tmp = tempfile.mkdtemp(prefix="extsort", dir=tmp_dir)
+    try:
+        jobs = [(path, dtype, s, min(run_items, total - s), _new_run(tmp, i), unique)
+                for i, s in enumerate(range(0, total, run_items))]
+        runs = _run_jobs(_sort_int_range, jobs, workers)
+        per_run = max(1 << 12, buffer_bytes // max(len(runs), 1) // np.dtype(dtype).itemsize)
+        yield from _merge_int_runs(runs, dtype, unique, per_run)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def sort_int_chunks(chunks, dtype=np.int64, run_items=RUN_ITEMS, unique=False,
+                    tmp_dir=None, buffer_bytes=1 << 26):
+    """Same as sort_int_file for an iterable of arrays (e.g. parsed text)."""
+    tmp = tempfile.mkdtemp(prefix="extsort", dir=tmp_dir)
+    try:
+        runs = []
+        pending, size = [], 0
+
+        def flush():
+            a = np.concatenate(pending).astype(dtype, copy=False)
+            a = np.unique(a) if unique else np.sort(a)
+            runs.append(_new_run(tmp, len(runs)))
+            a.tofile(runs[-1])
+            pending.clear()
+
+        for chunk in chunks:
+            pending.append(np.asarray(chunk, dtype=dtype))
+            size += len(pending[-1])
+            if size >= run_items:
+                flush()
+                size = 0
+        if pending:
+            flush()
+        per_run = max(1 << 12, buffer_bytes // max(len(runs), 1) // np.dtype(dtype).itemsize)
+        yield from _merge_int_runs(runs, dtype, unique, per_run)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# LINES - bytes comparison (locale-free, like LC_ALL=C sort)
+def sort_lines(path, run_bytes=RUN_BYTES, workers=0, unique=False, tmp_dir=None):
+    """Yield the file's lines (bytes, without b"\\n") in sorted order."""
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        # run boundaries just after a newline, so no line is split
+        while cuts[-1] + run_bytes < size:
+            f.seek(cuts[-1] + run_bytes)
+            f.readline()
+            if f.tell() >= size:
+                break
+            cuts.append(f.tell())
+    cuts.append(size)
+    tmp = tempfile.mkdtemp(prefix="extsort", dir=tmp_dir)
+    try:
+        jobs = [(path, a, b, _new_run(tmp, i), unique)
+                for i, (a, b) in enumerate(zip(cuts, cuts[1:]))]
+        runs = _run_jobs(_sort_line_range, jobs, workers)
+        yield from _merge_line_runs(runs, unique)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def write_blocks(blocks, out_path):
+    """Write sort_int_* output straight to a binary file."""
+    with open(out_path, "wb") as out:
+        for block in blocks:
+            block.tofile(out)
+
+
+def write_lines(lines, out_path):
+    with open(out_path, "wb", buffering=READ_BUFFER) as out:
+        for line in lines:
+            out.write(line)
+            out.write(b"\n")
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    tmp = tempfile.mkdtemp()
+    try:
+        src = os.path.join(tmp, "ints.bin")
+        data = np.random.default_rng(0).integers(0, 10**12, n)
+        data.tofile(src)
+        t = time.perf_counter()
+        out = np.concatenate(list(sort_int_file(src, run_items=n // 8 + 1, workers=workers)))
+        print(f"{n} ints, 8 runs: {time.perf_counter() - t:.2f}s, ok={np.array_equal(out, np.sort(data))}")
+
+        txt = os.path.join(tmp, "lines.txt")
+        m = n // 10
+        with open(txt, "wb") as f:
+            f.write(b"\n".join(b"%x" % v for v in data[:m].tolist()) + b"\n")
+        t = time.perf_counter()
+        count = sum(1 for _ in sort_lines(txt, run_bytes=os.path.getsize(txt) // 8 + 1,
+                                          workers=workers))
+        print(f"{m} lines, 8 runs: {time.perf_counter() - t:.2f}s, {count} lines out")
+
+        # Bytes below b"\n" after a common prefix (TSV rows)
+        rows = [b"a", b"a\tb", b"ab", b"a\x01", b""] * 200
+        with open(txt, "wb") as f:
+            f.write(b"\n".join(rows) + b"\n")
+        assert list(sort_lines(txt, run_bytes=500)) == sorted(rows)
+        assert list(sort_lines(txt, run_bytes=500, unique=True)) == sorted(set(rows))
+        print("tab / control-byte lines: ok")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# USAGE
+# for block in sort_int_file("ids.bin", dtype=np.uint32, workers=4): ...
+# write_blocks(sort_int_file("in.bin", unique=True), "out.bin")
+# for line in sort_lines("access.log", run_bytes=1 << 28): ...
+# write_lines(sort_lines("words.txt", unique=True), "sorted.txt")
+#
+# Text file of ints -> parse blocks cut at b"\n" (parse_ints from
+# python_csr_graph_ref.py), then:
+# sort_int_chunks(parse_ints(block) for block in text_blocks)
+
+# NOTE: temp space needed = input size; set tmp_dir to a roomy disk
+# NOTE: with workers, each worker holds one run in RAM: lower run_items
+# NOTE: iterator must be consumed (or closed) to delete the temp runs
+
+# TIME COMPLEXITY
+# runs: O(n log R) total (R = run size), in C, optionally parallel
+# merge: O(n log k) for ints via block sorts, O(n log k) heap for lines
+# I/O: each value read twice, written once
+# Memory: one run while sorting, ~buffer_bytes while merging
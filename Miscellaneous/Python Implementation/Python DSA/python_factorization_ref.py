@@ -0,0 +1,209 @@
+"""
+PRIMALITY & FACTORIZATION (LARGE n)
+====================================
+Deterministic Miller-Rabin + Pollard-rho (Brent) for n up to 10^18 and beyond
+"""
+
+import math
+import random
+from functools import lru_cache
+
+# WHY NOT SIEVE / TRIAL DIVISION?
+# sieve(n) needs O(n) memory -> useless for n = 10^18
+# trial division is O(sqrt(n)) = 10^9 steps per number
+# Miller-Rabin: O(k log^3 n), Pollard-rho: ~O(n^(1/4)) per factor
+
+# Small primes for quick trial division (all primes < 1000)
+SMALL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, int(p**0.5) + 1))]
+
+# The first 12 primes as bases make Miller-Rabin exact below this bound
+# (it is the smallest strong pseudoprime to all of them, ~3.2 * 10^23)
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+MR_DETERMINISTIC_LIMIT = 318665857834031151167461
+
+# 7 bases suffice for every n < 2^64 (Jim Sinclair's set)
+MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+
+# MILLER-RABIN
+def is_prime(n):
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 1000 * 1000:
+        return True  # no factor below 1000 <= sqrt(n)
+
+    # n - 1 = d * 2^s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    if n < 1 << 64:
+        bases = MR_BASES_64
+    else:
+        bases = MR_BASES
+    if n >= MR_DETERMINISTIC_LIMIT:
+        # Probabilistic beyond the proven bound: add random bases
+        bases = MR_BASES + tuple(random.randrange(2, n - 1) for _ in range(8))
+
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False  # a is a witness: n is composite
+    return True
+
+
+# POLLARD-RHO WITH BRENT'S CYCLE DETECTION
+# f(x) = x^2 + c mod n; the sequence cycles mod every prime factor p
+# Brent: tortoise jumps to the hare at powers of 2 (no double evaluation)
+# Batched gcd: multiply m differences together, one gcd per batch
+def pollard_brent(n, batch=128):
+    """Return a non-trivial factor of composite n."""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * (x - y) % n  # sign is irrelevant to the gcd
+                g = math.gcd(q, n)
+                k += batch
+            r <<= 1
+        if g == n:
+            # Batch overshot: replay one step at a time from the checkpoint
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(x - ys, n)
+        if g != n:
+            return g
+        # Unlucky c: retry with new parameters
+
+
+# FULL FACTORIZATION
+def factorize(n):
+    """Sorted list of prime factors with multiplicity, e.g. 12 -> [2, 2, 3]."""
+    if n < 1:
+        raise ValueError("n must be positive")
+    return list(_factorize_cached(n))
+
+
+def factor_counts(n):
+    """Dict {prime: exponent}, e.g. 12 -> {2: 2, 3: 1}."""
+    if n < 1:
+        raise ValueError("n must be positive")
+    counts = {}
+    for p in _factorize_cached(n):
+        counts[p] = counts.get(p, 0) + 1
+    return counts
+
+
+@lru_cache(maxsize=1 << 16)
+def _factorize_cached(n):
+    # Cached as a tuple so repeated inputs in a stream cost one dict lookup
+    factors = []
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    if n > 1:
+        stack = [n]
+        while stack:
+            m = stack.pop()
+            if m == 1:
+                continue
+            if is_prime(m):
+                factors.append(m)
+                continue
+            r = math.isqrt(m)
+            if r * r == m:
+                # Perfect squares are the worst case for rho, split directly
+                stack += [r, r]
+                continue
+            d = pollard_brent(m)
+            stack += [d, m // d]
+    factors.sort()
+    return tuple(factors)
+
+
+def factorize_many(nums):
+    """Factor a stream of numbers; repeats hit the cache."""
+    return [factorize(n) for n in nums]
+
+
+# DIVISORS FROM FACTORIZATION
+def divisors(n):
+    divs = [1]
+    for p, e in factor_counts(n).items():
+        divs = [d * p**k for d in divs for k in range(e + 1)]
+    return sorted(divs)
+
+
+# USAGE
+# is_prime(10**18 + 9)                 # True
+# is_prime(10**18 + 1)                 # False
+# is_prime(2**61 - 1)                  # True
+# factorize(10**18)                    # [2]*18 + [5]*18
+# factorize(1000000007 * 998244353)    # [998244353, 1000000007]
+# factor_counts(360)                   # {2: 3, 3: 2, 5: 1}
+# _factorize_cached.cache_info()       # hit/miss stats for streams
+
+# NOTE: is_prime is exact below ~3.2 * 10^23, probabilistic above
+# NOTE: results are cached (LRU, 65536 entries); cache_clear() to reset
+# NOTE: random 18-digit inputs are mostly small factors + one big prime;
+#       balanced semiprimes (two ~9-digit primes) are the slow case,
+#       ~110/s vs ~1900/s for random inputs (see the benchmark)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = random.Random(1)
+    nums = [rng.randrange(10**17, 10**18) for _ in range(2000)]
+    t = time.perf_counter()
+    for x in nums:
+        f = factorize(x)
+        assert math.prod(f) == x and all(is_prime(p) for p in f)
+    dt = time.perf_counter() - t
+    print(f"{len(nums)} random 18-digit numbers: {len(nums) / dt:.0f}/s")
+
+    # Worst case for rho: two 9-digit prime factors
+    def prime9():
+        while True:
+            p = rng.randrange(10**8, 10**9)
+            if is_prime(p):
+                return p
+
+    semis = [prime9() * prime9() for _ in range(500)]
+    t = time.perf_counter()
+    for x in semis:
+        assert len(factorize(x)) == 2
+    dt = time.perf_counter() - t
+    print(f"{len(semis)} balanced semiprimes (9 + 9 digits): {len(semis) / dt:.0f}/s")
+
+# TIME COMPLEXITY
+# is_prime: O(7 * log^3 n) for 64-bit n
+# pollard_brent: ~O(n^(1/4)) expected per split
+# factorize: O(log n) splits; cached repeats are O(1)
@@ -0,0 +1,120 @@
+"""
+FRONTIER BFS (VECTORIZED)
+=========================
+Level-synchronous BFS over a CSRGraph, one NumPy pass per level
+"""
+
+import numpy as np
+
+# WHY?
+# The deque BFS in python_queue_ref.py touches every edge in Python:
+#   popleft + for neighbor + set lookup  ->  ~10^6 edges/s
+# Level-synchronous BFS handles a whole frontier at once:
+#   1. gather   all neighbor slices of the frontier  (repeat + arange)
+#   2. mask     neighbors already visited             (bool array)
+#   3. dedupe   nodes reached from several parents    (last-writer-wins claim)
+# Python work is O(levels), everything else runs in C.
+
+
+def _expand(indptr, indices, frontier):
+    # Neighbors of every frontier node, plus who they came from
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return None, None
+    # slot of k-th gathered edge = starts[owner] + (k - first k of owner)
+    first = np.cumsum(counts) - counts
+    pos = np.arange(total, dtype=np.int64) + np.repeat(starts - first, counts)
+    return indices[pos], np.repeat(frontier, counts)
+
+
+def multi_source_bfs(graph, sources, max_depth=None):
+    """BFS from every node in `sources` at once.
+
+    Returns (dist, parent, origin) as int64 arrays; unreached nodes are -1.
+    origin[v] is the source whose search tree contains v.
+    """
+    n = graph.n
+    indptr = graph.indptr
+    indices = graph.indices
+    dist = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    origin = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    claim = np.empty(n, dtype=np.int64)  # scratch for deduplication
+
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    visited[frontier] = True
+    dist[frontier] = 0
+    origin[frontier] = frontier
+    level = 0
+    while len(frontier) and (max_depth is None or level < max_depth):
+        nbrs, owners = _expand(indptr, indices, frontier)
+        if nbrs is None:
+            break
+        fresh = ~visited[nbrs]
+        nbrs = nbrs[fresh]
+        owners = owners[fresh]
+        # Dedupe without sorting: every copy writes its slot, the last wins
+        slots = np.arange(len(nbrs), dtype=np.int64)
+        claim[nbrs] = slots
+        keep = claim[nbrs] == slots
+        frontier = nbrs[keep].astype(np.int64)
+        owners = owners[keep]
+
+        level += 1
+        visited[frontier] = True
+        dist[frontier] = level
+        parent[frontier] = owners
+        origin[frontier] = origin[owners]
+    return dist, parent, origin
+
+
+def bfs(graph, source, max_depth=None):
+    """Single-source BFS: (dist, parent) int64 arrays, -1 = unreached."""
+    dist, parent, _ = multi_source_bfs(graph, [source], max_depth)
+    return dist, parent
+
+
+def bfs_levels(graph, source):
+    """List of node arrays, one per BFS level."""
+    dist, _ = bfs(graph, source)
+    reached = np.flatnonzero(dist >= 0)
+    order = reached[np.argsort(dist[reached], kind='stable')]
+    cuts = np.searchsorted(dist[order], np.arange(1, dist.max() + 1))
+    return np.split(order, cuts)
+
+
+# PATH FROM THE PARENT ARRAY
+def path_to(parent, target):
+    # Check dist[target] >= 0 first: an unreached target returns [target]
+    path = [int(target)]
+    while parent[path[-1]] != -1:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+# CP EXAMPLE - Message Route (CSES): shortest path 1 -> n or IMPOSSIBLE
+def message_route(graph):
+    dist, parent = bfs(graph, 0)
+    t = graph.n - 1
+    if dist[t] < 0:
+        return "IMPOSSIBLE"
+    return [v + 1 for v in path_to(parent, t)]
+
+
+# USAGE
+# from python_csr_graph_ref import CSRGraph
+# g = CSRGraph.from_edges(n, u, v, directed=False)
+# dist, parent = bfs(g, 0)
+# dist, parent, origin = multi_source_bfs(g, [0, 5, 9])   # nearest source
+# path_to(parent, t)                                       # [s, ..., t]
+
+# NOTE: best on wide / low-diameter graphs; a long path graph has n levels
+#       of size 1 and falls back to per-level NumPy overhead
+# NOTE: path_to walks parents in Python, O(path length)
+
+# TIME COMPLEXITY
+# O(n + m) total work in C, O(diameter) Python iterations
+# Memory: O(n) + O(largest frontier's edge count)
@@ -0,0 +1,246 @@
+"""
+GRID BFS / FLOOD FILL (FLAT INDEX)
+==================================
+Padded 1D grids: no tuples, no bounds checks, 4 / 8 neighbors
+"""
+
+from array import array
+from collections import deque
+from functools import lru_cache
+
+# WHY?
+# The usual grid BFS (dirs + in_bounds from python_cp_tricks_ref.py):
+#   queue of (r, c) tuples, visited set of tuples, 4 bounds checks per step
+# Flat + padded:
+#   cell (r, c) -> i = (r + 1) * W + (c + 1), W = cols + 2
+#   a ring of wall cells around the grid, so i + d is always a valid index
+#   neighbors are i + 1, i - 1, i + W, i - W (+ diagonals i +- W +- 1)
+# Preallocated array('i') queue / stack, array('i') distances, bytearray walls.
+
+
+class Grid:
+    def __init__(self, rows, wall="#"):
+        """rows: list of strings (or bytes); any `wall` char is blocked."""
+        self.rows = len(rows)
+        self.cols = len(rows[0]) if rows else 0
+        W = self.W = self.cols + 2
+        self.H = self.rows + 2
+        wall = ord(wall) if isinstance(wall, str) else wall
+        # open_[i] = 1 if walkable; padding ring stays 0
+        open_ = bytearray(W * self.H)
+        for r, row in enumerate(rows):
+            line = _row_bytes(row, self.cols, r)
+            start = (r + 1) * W + 1
+            open_[start:start + self.cols] = line.translate(_open_table(wall))
+        self.open = open_
+        self.raw = rows
+
+    @classmethod
+    def from_array(cls, passable):
+        """From a 2D bool NumPy array / nested lists (True = walkable)."""
+        grid = cls.__new__(cls)
+        grid.rows = len(passable)
+        grid.cols = len(passable[0]) if grid.rows else 0
+        W = grid.W = grid.cols + 2
+        grid.H = grid.rows + 2
+        grid.open = bytearray(W * grid.H)
+        for r in range(grid.rows):
+            start = (r + 1) * W + 1
+            grid.open[start:start + grid.cols] = _row_bytes(
+                bytes(bool(x) for x in passable[r]), grid.cols, r)
+        grid.raw = None
+        return grid
+
+    # INDEX HELPERS
+    def idx(self, r, c):
+        return (r + 1) * self.W + c + 1
+
+    def rc(self, i):
+        r, c = divmod(i, self.W)
+        return r - 1, c - 1
+
+    def find(self, ch):
+        """Flat indices of every cell equal to `ch` in the original rows."""
+        out = []
+        for r, row in enumerate(self.raw):
+            c = row.find(ch)
+            while c != -1:
+                out.append(self.idx(r, c))
+                c = row.find(ch, c + 1)
+        return out
+
+    def offsets(self, diagonal=False):
+        W = self.W
+        if diagonal:
+            return (1, -1, W, -W, W + 1, W - 1, -W + 1, -W - 1)
+        return (1, -1, W, -W)
+
+    # MULTI-SOURCE BFS - distances (padded layout, -1 = unreachable)
+    def bfs(self, sources, diagonal=False, want_parent=False):
+        size = self.W * self.H
+        dist = array('i', [-1]) * size
+        parent = array('i', [-1]) * size if want_parent else None
+        open_ = self.open
+        dirs = self.offsets(diagonal)
+        # every cell is queued at most once: one preallocated int array,
+        # head / tail indices (no popleft, no list of boxed ints)
+        queue = array('i', bytes(4 * size))
+        tail = 0
+        for s in sources:
+            if open_[s] and dist[s] < 0:
+                dist[s] = 0
+                queue[tail] = s
+                tail += 1
+        head = 0
+        while head < tail:
+            i = queue[head]
+            head += 1
+            d = dist[i] + 1
+            for off in dirs:
+                j = i + off
+                if open_[j] and dist[j] < 0:
+                    dist[j] = d
+                    if parent is not None:
+                        parent[j] = i
+                    queue[tail] = j
+                    tail += 1
+        return (dist, parent) if want_parent else dist
+
+    def path(self, parent, target):
+        """Flat indices from the BFS source to target (via bfs(want_parent=True))."""
+        out = [target]
+        while parent[out[-1]] >= 0:
+            out.append(parent[out[-1]])
+        return out[::-1]
+
+    # CONNECTED COMPONENTS - label per cell (0 = wall, 1..k = component)
+    def components(self, diagonal=False):
+        size = self.W * self.H
+        label = array('i', bytes(4 * size))
+        open_ = self.open
+        dirs = self.offsets(diagonal)
+        stack = array('i', bytes(4 * size))  # each cell pushed at most once
+        k = 0
+        i = open_.find(1)
+        while i != -1:
+            if not label[i]:
+                k += 1
+                label[i] = k
+                stack[0] = i
+                top = 1
+                while top:
+                    top -= 1
+                    u = stack[top]
+                    for off in dirs:
+                        v = u + off
+                        if open_[v] and not label[v]:
+                            label[v] = k
+                            stack[top] = v
+                            top += 1
+            i = open_.find(1, i + 1)
+        return label, k
+
+    # 0-1 BFS - entering cell j costs cost[j] (0 or 1)
+    # e.g. cost 1 for '#' and 0 for '.', with every cell walkable:
+    # "minimum walls to break"
+    def zero_one_bfs(self, sources, cost, diagonal=False):
+        size = self.W * self.H
+        INF = (1 << 31) - 1
+        dist = array('i', [INF]) * size
+        open_ = self.open
+        dirs = self.offsets(diagonal)
+        dq = deque()
+        for s in sources:
+            dist[s] = 0
+            dq.append(s)
+        while dq:
+            i = dq.popleft()
+            d = dist[i]
+            for off in dirs:
+                j = i + off
+                if not open_[j]:
+                    continue
+                nd = d + cost[j]
+                if nd < dist[j]:
+                    dist[j] = nd
+                    if cost[j]:
+                        dq.append(j)
+                    else:
+                        dq.appendleft(j)
+        return dist
+
+    def cost_from(self, chars_cost_1):
+        """Padded cost bytes: 1 for cells whose char is in chars_cost_1."""
+        cost = bytearray(self.W * self.H)
+        table = bytes(1 if chr(b) in chars_cost_1 else 0 for b in range(256))
+        for r, row in enumerate(self.raw):
+            line = _row_bytes(row, self.cols, r)
+            start = self.idx(r, 0)
+            cost[start:start + self.cols] = line.translate(table)
+        return cost
+
+    # BACK TO 2D
+    def unpad(self, flat):
+        """List of rows without the padding ring."""
+        W = self.W
+        return [list(flat[(r + 1) * W + 1:(r + 1) * W + 1 + self.cols]) for r in range(self.rows)]
+
+
+def _row_bytes(row, cols, r):
+    # A short / long row would resize the bytearray slice and shift every
+    # later flat index, so ragged input is an error
+    line = row.encode() if isinstance(row, str) else bytes(row)
+    if len(line) != cols:
+        raise ValueError(f"row {r} has length {len(line)}, expected {cols}")
+    return line
+
+
+@lru_cache(maxsize=None)
+def _open_table(wall):
+    # bytes.translate table: wall byte -> 0, everything else -> 1
+    return bytes(0 if b == wall else 1 for b in range(256))
+
+
+# CP EXAMPLES
+
+# Counting Rooms (CSES)
+def counting_rooms(rows):
+    return Grid(rows).components()[1]
+
+# Labyrinth (CSES): path A -> B as "LRUD" string, or None
+def labyrinth(rows):
+    g = Grid(rows)
+    a, = g.find("A")
+    b, = g.find("B")
+    dist, parent = g.bfs([a], want_parent=True)
+    if dist[b] < 0:
+        return None
+    step = {1: "R", -1: "L", g.W: "D", -g.W: "U"}
+    p = g.path(parent, b)
+    return "".join(step[j - i] for i, j in zip(p, p[1:]))
+
+# Minimum walls to break from top-left to bottom-right
+def min_walls(rows):
+    g = Grid(rows, wall="\0")  # nothing blocked
+    dist = g.zero_one_bfs([g.idx(0, 0)], g.cost_from("#"))
+    return dist[g.idx(g.rows - 1, g.cols - 1)]
+
+
+# USAGE
+# g = Grid(["..#", ".#.", "..."])
+# dist = g.bfs([g.idx(0, 0)])            # padded flat distances
+# dist[g.idx(2, 2)]                      # read one cell
+# g.unpad(dist)                          # 2D view when needed
+# labels, k = g.components(diagonal=True)
+
+# NOTE: every index in / out is a FLAT PADDED index - use idx() / rc()
+# NOTE: unreachable = -1 in bfs, but 2^31 - 1 in zero_one_bfs (it relaxes
+#       with <, so "infinity" must compare larger than any distance)
+# NOTE: rows must all have the same length (ValueError otherwise)
+# NOTE: 4000 x 4000 grid = 16M cells: bytearray 16 MB, each array('i') 64 MB
+#       -> bfs peaks ~150 MB (dist + queue, +64 MB with parents), ~10 s
+#       for a fully open grid (a list queue was ~700 MB of boxed ints)
+
+# TIME COMPLEXITY
+# bfs / components / zero_one_bfs: O(rows * cols * neighbors)
+# Memory: 1 byte walls + 4 bytes per distance / label + 4 bytes queue / stack
@@ -0,0 +1,109 @@
+"""
+MINIMUM SPANNING FOREST (KRUSKAL)
+=================================
+Edges as parallel NumPy arrays, argsort once, tight DSU loop
+"""
+
+import numpy as np
+
+from python_dsu_ref import DSU
+
+# WHY?
+# edges.sort() on (w, u, v) tuples: 3 objects per edge + tuple compares
+# np.argsort(w): one C sort over a flat array, ~2 s for 10^7 edges
+# The DSU loop is the only Python-level work, and it stops as soon as
+# the forest is complete (n - components merges).
+
+_BLOCK = 1 << 18  # edges converted to Python ints per step
+
+
+def kruskal(n, u, v, w):
+    """Minimum spanning forest of an undirected graph.
+
+    u, v, w: parallel arrays (edge i joins u[i] - v[i] with weight w[i]).
+    Returns (total weight, indices of chosen edges, component label per node).
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    order = np.argsort(w, kind='stable')  # equal weights keep input order
+
+    dsu = DSU(n)
+    parent = dsu.parent
+    size = dsu.size
+    chosen = []
+    add = chosen.append
+    need = n - 1
+    # Convert in blocks so an early finish skips converting the tail
+    for start in range(0, len(order) if need > 0 else 0, _BLOCK):
+        idx = order[start:start + _BLOCK]
+        for i, x, y in zip(idx.tolist(), u[idx].tolist(), v[idx].tolist()):
+            while parent[x] != x:
+                parent[x] = x = parent[parent[x]]
+            while parent[y] != y:
+                parent[y] = y = parent[parent[y]]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            add(i)
+        if len(chosen) == need:
+            break  # spanning tree complete, skip the remaining edges
+    dsu.components = n - len(chosen)
+
+    chosen = np.array(chosen, dtype=np.int64)
+    total = w[chosen].sum() if len(chosen) else w.dtype.type(0)
+    labels = np.frombuffer(dsu.labels(), dtype=np.int32)
+    return total, chosen, labels
+
+
+# MAXIMUM SPANNING FOREST - same thing on negated weights
+def max_spanning_forest(n, u, v, w):
+    total, chosen, labels = kruskal(n, u, v, -np.asarray(w))
+    return -total, chosen, labels
+
+
+# CP EXAMPLE - Road Reparation (CSES): MST cost or IMPOSSIBLE
+def road_reparation(n, edges):
+    # edges: list of (a, b, cost), 1-indexed nodes
+    arr = np.array(edges, dtype=np.int64).reshape(-1, 3)
+    total, chosen, labels = kruskal(n, arr[:, 0] - 1, arr[:, 1] - 1, arr[:, 2])
+    return int(total) if len(chosen) == n - 1 else "IMPOSSIBLE"
+
+
+# USAGE
+# total, idx, labels = kruskal(n, u, v, w)
+# u[idx], v[idx]                 # MST edges
+# labels.max() + 1               # number of trees in the forest
+
+# NOTE: nodes are 0..n-1; self-loops and parallel edges are fine
+# NOTE: total has w's dtype (int64 / float64)
+
+
+# BENCHMARK - 10^6 nodes, 10^7 random edges (python python_mst_ref.py [m])
+if __name__ == "__main__":
+    import sys
+    import time
+
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    n = max(2, m // 10)
+    rng = np.random.default_rng(0)
+    u = rng.integers(0, n, m, dtype=np.int32)
+    v = rng.integers(0, n, m, dtype=np.int32)
+    w = rng.integers(1, 10**9, m, dtype=np.int64)
+
+    t = time.perf_counter()
+    order = np.argsort(w, kind='stable')
+    t_sort = time.perf_counter() - t
+
+    t = time.perf_counter()
+    total, chosen, labels = kruskal(n, u, v, w)
+    t_all = time.perf_counter() - t
+    print(f"n={n} m={m}: argsort {t_sort:.2f}s, kruskal total {t_all:.2f}s")
+    print(f"weight={total} edges={len(chosen)} trees={labels.max() + 1}")
+
+# TIME COMPLEXITY
+# O(m log m) sort (C) + O(m * alpha(n)) DSU loop (Python)
+# Memory: O(n + m) flat arrays
@@ -0,0 +1,182 @@
+"""
+STREAMING QUANTILE SKETCH (KLL)
+===============================
+Bounded memory median / percentiles over billions of values, mergeable
+"""
+
+import numpy as np
+
+# WHY?
+# MedianFinder (python_heap_ref.py) keeps every value: 10^9 floats = 8 GB
+# plus heap overhead. A sketch keeps O(k log(n / k)) values and answers any
+# quantile with rank error ~ 1 / k (k = 200 -> ~1% of n), with no
+# assumption about the distribution.
+#
+# KLL = a stack of compactors, level h items each stand for 2^h values
+#   level 0  <- new values
+#   level h full (> capacity(h)):  sort, keep every other item starting at a
+#             random offset 0 / 1, promote those to level h + 1 (weight x2)
+#   capacity(h) = k * (2/3)^(top - h): small low levels, top level ~ k
+# Random offset keeps the rank error unbiased.
+#
+# Merge = concatenate level by level, then compact -> per-worker sketches
+# combine into one with the same guarantee.
+
+C = 2 / 3
+MIN_CAPACITY = 2
+
+
+class KLLSketch:
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self.buffer = []  # single addNum calls, flushed in batches
+        self.rng = np.random.default_rng(seed)
+        self._sorted = None  # (values, cumulative weights) cache
+
+    def __len__(self):
+        return self.n + len(self.buffer)
+
+    def _capacity(self, h):
+        top = len(self.levels) - 1
+        return max(MIN_CAPACITY, int(np.ceil(self.k * C ** (top - h))))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                even = len(level) & ~1
+                promoted = level[self.rng.integers(2):even:2]
+                self.levels[h] = level[even:]  # odd one out stays
+                self.levels[h + 1] = np.concatenate((self.levels[h + 1], promoted))
+            h += 1
+
+    # ADD
+    def add_many(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+        self._sorted = None
+
+    def _flush(self):
+        if self.buffer:
+            buffer, self.buffer = self.buffer, []
+            self.add_many(buffer)
+
+    def addNum(self, num):
+        self.buffer.append(num)
+        if len(self.buffer) >= self.k:
+            self._flush()
+
+    add = addNum
+
+    # MERGE - other sketch is left unchanged
+    def merge(self, other):
+        other._flush()
+        self._flush()
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate((self.levels[h], level))
+        self.n += other.n
+        self._compress()
+        self._sorted = None
+        return self
+
+    # QUERY
+    def _cdf(self):
+        self._flush()
+        if self._sorted is None:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(lv), 1 << h, dtype=np.int64)
+                                      for h, lv in enumerate(self.levels)])
+            order = np.argsort(values, kind='stable')
+            self._sorted = values[order], np.cumsum(weights[order])
+        return self._sorted
+
+    def quantiles(self, qs):
+        """Values at fractions qs (array-like in [0, 1])."""
+        values, cum = self._cdf()
+        if len(values) == 0:
+            raise ValueError("empty sketch")
+        qs = np.asarray(qs, dtype=np.float64)
+        idx = np.searchsorted(cum, qs * cum[-1], side='left')
+        return values[np.minimum(idx, len(values) - 1)]
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+    def findMedian(self):
+        return self.quantile(0.5)
+
+    def rank(self, x):
+        """Approximate number of values <= x."""
+        values, cum = self._cdf()
+        i = np.searchsorted(values, x, side='right')
+        return int(cum[i - 1]) if i else 0
+
+    def cdf(self, x):
+        return self.rank(x) / max(len(self), 1)
+
+    def retained(self):
+        """Values actually stored (memory = 8 bytes each)."""
+        return sum(len(lv) for lv in self.levels) + len(self.buffer)
+
+
+# CP EXAMPLE - Find Median from Data Stream (LeetCode 295), bounded memory
+# (approximate: a drop-in for MedianFinder when exact answers aren't needed)
+MedianFinder = KLLSketch
+
+
+# Per-worker latency sketches -> one p50 / p99 / p999 report
+def merged_percentiles(chunks, qs=(0.5, 0.99, 0.999), k=400):
+    total = KLLSketch(k)
+    for chunk in chunks:
+        part = KLLSketch(k)
+        part.add_many(chunk)
+        total.merge(part)
+    return total.quantiles(qs)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    data = np.random.default_rng(1).lognormal(size=n)
+    sketch = KLLSketch(200, seed=0)
+    t = time.perf_counter()
+    for s in range(0, n, 1 << 16):
+        sketch.add_many(data[s:s + (1 << 16)])
+    dt = time.perf_counter() - t
+    qs = np.array([0.01, 0.5, 0.9, 0.99])
+    est = sketch.quantiles(qs)
+    true_rank = np.searchsorted(np.sort(data), est) / n
+    print(f"n={n}: {dt:.2f}s, retained {sketch.retained()} values")
+    print("rank error:", np.round(np.abs(true_rank - qs), 4))
+
+
+# USAGE
+# s = KLLSketch(k=200)
+# s.addNum(3.5); s.add_many(np_array)
+# s.findMedian(); s.quantile(0.99); s.quantiles([0.5, 0.9, 0.99])
+# s.merge(other_sketch)                  # e.g. sketches returned by workers
+# s.rank(x), s.cdf(x)
+
+# NOTE: values are stored as float64 (ints beyond 2^53 lose precision)
+# NOTE: answers are actual stream values, rank error ~ n / k with high prob.
+# NOTE: sketches pickle as plain NumPy arrays (multiprocessing-friendly)
+
+# TIME COMPLEXITY
+# add_many: O(m log m) amortized per batch of m, in NumPy
+# addNum: O(1) amortized (buffered)
+# query: O(S log S) first time after an update (S = retained), then O(log S)
+# Memory: O(k log(n / k)) values, ~3k in practice
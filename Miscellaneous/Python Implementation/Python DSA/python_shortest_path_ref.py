@@ -0,0 +1,152 @@
+"""
+SHORTEST PATHS (WEIGHTED)
+=========================
+Dijkstra with an indexed heap, 0-1 BFS, Dial's bucket queue - over CSRGraph
+"""
+
+from collections import deque
+
+from python_indexed_heap_ref import IndexedMinHeap
+
+INF = float('inf')
+
+# PICK THE RIGHT ONE
+# weights in {0, 1}          -> zero_one_bfs    O(V + E)
+# small ints 0..C            -> dial            O(V * C + E)
+# any non-negative weights   -> dijkstra        O((V + E) log V)
+# negative weights           -> Bellman-Ford / SPFA (not here)
+#
+# All take a CSRGraph with weights (python_csr_graph_ref.py) and return
+# (dist, parent) lists: dist[v] = INF and parent[v] = -1 when unreachable.
+
+
+def _adjacency(graph):
+    # memoryviews: zero-copy, slicing / indexing gives plain Python numbers
+    if graph.weights is None:
+        raise ValueError("graph has no weights")
+    return memoryview(graph.indptr), memoryview(graph.indices), memoryview(graph.weights)
+
+
+# DIJKSTRA - indexed heap: one entry per node, decrease-key on improvement
+def dijkstra(graph, source, target=None):
+    ptr, idx, wts = _adjacency(graph)
+    n = graph.n
+    dist = [INF] * n
+    parent = [-1] * n
+    done = bytearray(n)
+    pq = IndexedMinHeap(n)
+    dist[source] = 0
+    pq.push(source, 0)
+    push, pop, decrease = pq.push, pq.pop, pq.decrease_key
+    contains = pq.pos
+    while pq.heap:
+        u, du = pop()
+        if u == target:
+            break
+        done[u] = 1
+        for k in range(ptr[u], ptr[u + 1]):
+            v = idx[k]
+            if done[v]:
+                continue
+            nd = du + wts[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                if contains[v] >= 0:
+                    decrease(v, nd)
+                else:
+                    push(v, nd)
+    return dist, parent
+
+
+# 0-1 BFS - deque: weight 0 -> front, weight 1 -> back
+def zero_one_bfs(graph, source):
+    ptr, idx, wts = _adjacency(graph)
+    n = graph.n
+    dist = [INF] * n
+    parent = [-1] * n
+    dist[source] = 0
+    dq = deque([source])
+    while dq:
+        u = dq.popleft()
+        du = dist[u]
+        for k in range(ptr[u], ptr[u + 1]):
+            v = idx[k]
+            w = wts[k]
+            if du + w < dist[v]:
+                dist[v] = du + w
+                parent[v] = u
+                if w:
+                    dq.append(v)
+                else:
+                    dq.appendleft(v)
+    return dist, parent
+
+
+# DIAL'S ALGORITHM - bucket queue for integer weights 0..C
+# Tentative distances in flight span at most C + 1 values, so a ring of
+# C + 1 buckets indexed by dist % (C + 1) is enough.
+def dial(graph, source, max_weight=None):
+    ptr, idx, wts = _adjacency(graph)
+    if max_weight is None:
+        max_weight = int(graph.weights.max()) if len(graph.weights) else 0
+    n = graph.n
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    dist = [INF] * n
+    parent = [-1] * n
+    dist[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    d = 0
+    while pending:
+        bucket = buckets[d % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue  # stale: u was improved into an earlier bucket
+            for k in range(ptr[u], ptr[u + 1]):
+                v = idx[k]
+                nd = d + wts[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    buckets[nd % size].append(v)
+                    pending += 1
+        d += 1
+    return dist, parent
+
+
+def path_to(parent, target):
+    path = [target]
+    while parent[path[-1]] != -1:
+        path.append(parent[path[-1]])
+    return path[::-1]
+
+
+# CP EXAMPLE - Shortest Routes I (CSES): distances from city 1
+def shortest_routes(n, edges):
+    import numpy as np
+    from python_csr_graph_ref import CSRGraph
+
+    e = np.array(edges, dtype=np.int64).reshape(-1, 3)
+    g = CSRGraph.from_edges(n, e[:, 0] - 1, e[:, 1] - 1, e[:, 2])
+    return dijkstra(g, 0)[0]
+
+
+# USAGE
+# g = CSRGraph.from_edges(n, u, v, w, directed=False)
+# dist, parent = dijkstra(g, 0)
+# dist, parent = dijkstra(g, s, target=t)    # stop once t is settled
+# dist, _ = zero_one_bfs(g, 0)               # weights 0 / 1 only
+# dist, _ = dial(g, 0)                       # small non-negative ints
+# path_to(parent, t)
+
+# NOTE: weights must be non-negative
+# NOTE: dial keeps stale entries (no decrease-key), skipped via dist check
+
+# TIME COMPLEXITY
+# dijkstra: O((V + E) log V), heap size <= V
+# zero_one_bfs: O(V + E)
+# dial: O(V + E + max_dist) with C + 1 buckets
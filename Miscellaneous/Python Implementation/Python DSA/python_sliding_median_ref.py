@@ -0,0 +1,271 @@
+"""
+SLIDING-WINDOW MEDIAN / PERCENTILE
+==================================
+Two heaps with lazy deletion + compaction, and a sorted-bucket alternative
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+# WHY?
+# MedianFinder (python_heap_ref.py) only inserts. A window also has to
+# REMOVE the value that slides out, and heapq can't delete from the middle.
+#
+# Two heaps, lazy deletion:
+#   lo = max-heap of the smallest `need` values, hi = min-heap of the rest
+#   remove(x): just count it in `delayed`, fix the sizes, and only pop it
+#              physically once it reaches the top of its heap
+#   compaction: if dead entries outnumber live ones, rebuild both heaps
+#              (otherwise rare-at-top values could pile up forever)
+#
+# Sorted buckets: the window as ~k / LOAD sorted lists of <= 2 * LOAD items.
+#   insert/remove = bisect + list insert/del inside one small bucket
+#   k-th value    = walk bucket lengths
+# No dead entries at all, any rank readable (kth / count_le); fastest for
+# windows up to ~10^4, the heaps take over beyond that.
+#
+# Percentile q uses linear interpolation between ranks (NumPy's default):
+#   pos = q * (k - 1), answer = s[floor(pos)] + frac * (s[ceil(pos)] - s[floor(pos)])
+# so q = 0.5 on an even window is the mean of the two middle values.
+
+
+def _rank(k, q):
+    if not 0 <= q <= 1:
+        raise ValueError("q must be in [0, 1]")
+    pos = q * (k - 1)
+    i = int(pos + 1e-9)  # q = r / (k - 1) must land exactly on rank r
+    return i, max(0.0, pos - i)
+
+
+def _interpolate(a, b, frac):
+    if frac == 0:
+        return a
+    if frac == 0.5:
+        return (a + b) / 2
+    return a + (b - a) * frac
+
+
+# TWO HEAPS + LAZY DELETION
+class HeapPercentile:
+    def __init__(self, k, q=0.5):
+        self.i, self.frac = _rank(k, q)
+        self.need = self.i + 1  # live values that belong in lo
+        self.lo = []  # max-heap (negated)
+        self.hi = []  # min-heap
+        self.lo_size = 0
+        self.hi_size = 0
+        self.delayed = {}
+        self.dead = 0
+
+    def __len__(self):
+        return self.lo_size + self.hi_size
+
+    def _prune(self, heap, sign):
+        delayed = self.delayed
+        while heap:
+            x = heap[0] * sign
+            c = delayed.get(x)
+            if not c:
+                return
+            if c == 1:
+                del delayed[x]
+            else:
+                delayed[x] = c - 1
+            heapq.heappop(heap)
+            self.dead -= 1
+
+    def _balance(self):
+        lo, hi = self.lo, self.hi
+        while self.lo_size > self.need:
+            heapq.heappush(hi, -heapq.heappop(lo))
+            self.lo_size -= 1
+            self.hi_size += 1
+            self._prune(lo, -1)
+        while self.lo_size < self.need and self.hi_size:
+            heapq.heappush(lo, -heapq.heappop(hi))
+            self.hi_size -= 1
+            self.lo_size += 1
+            self._prune(hi, 1)
+
+    def add(self, x):
+        if not self.lo or x <= -self.lo[0]:
+            heapq.heappush(self.lo, -x)
+            self.lo_size += 1
+        else:
+            heapq.heappush(self.hi, x)
+            self.hi_size += 1
+        self._balance()
+
+    def remove(self, x):
+        """x must currently be in the window."""
+        self.delayed[x] = self.delayed.get(x, 0) + 1
+        self.dead += 1
+        if x <= -self.lo[0]:
+            self.lo_size -= 1
+            if x == -self.lo[0]:
+                self._prune(self.lo, -1)
+        else:
+            self.hi_size -= 1
+            if x == self.hi[0]:
+                self._prune(self.hi, 1)
+        self._balance()
+        if self.dead > len(self) + 64:
+            self._compact()
+
+    def _compact(self):
+        # Drop every dead entry in one pass, then re-heapify
+        delayed = self.delayed
+        live_lo, live_hi = [], []
+        for heap, out, sign in ((self.lo, live_lo, -1), (self.hi, live_hi, 1)):
+            for v in heap:
+                c = delayed.get(v * sign)
+                if c:
+                    delayed[v * sign] = c - 1
+                else:
+                    out.append(v)
+        heapq.heapify(live_lo)
+        heapq.heapify(live_hi)
+        self.lo, self.hi = live_lo, live_hi
+        self.delayed = {}
+        self.dead = 0
+
+    def query(self):
+        """Percentile of a FULL window (k values)."""
+        a = -self.lo[0]
+        if self.frac == 0:
+            return a
+        return _interpolate(a, self.hi[0], self.frac)
+
+
+# SORTED BUCKETS (sqrt decomposition)
+class BucketPercentile:
+    LOAD = 4096  # list insert/del is a C memmove: big buckets, short walks
+
+    def __init__(self, k, q=0.5):
+        self.i, self.frac = _rank(k, q)
+        self.buckets = []
+        self.maxes = []  # maxes[b] = buckets[b][-1]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, x):
+        buckets, maxes = self.buckets, self.maxes
+        self.size += 1
+        if not buckets:
+            buckets.append([x])
+            maxes.append(x)
+            return
+        b = bisect_left(maxes, x)
+        if b == len(buckets):
+            b -= 1
+            buckets[b].append(x)
+            maxes[b] = x
+        else:
+            insort(buckets[b], x)
+        if len(buckets[b]) > 2 * self.LOAD:
+            bucket = buckets[b]
+            half = len(bucket) >> 1
+            buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+
+    def remove(self, x):
+        buckets, maxes = self.buckets, self.maxes
+        b = bisect_left(maxes, x)
+        bucket = buckets[b]
+        del bucket[bisect_left(bucket, x)]
+        self.size -= 1
+        if bucket:
+            maxes[b] = bucket[-1]
+        else:
+            del buckets[b]
+            del maxes[b]
+
+    def kth(self, i):
+        """i-th smallest value (0-indexed)."""
+        for bucket in self.buckets:
+            if i < len(bucket):
+                return bucket[i]
+            i -= len(bucket)
+        raise IndexError("rank out of range")
+
+    def query(self):
+        a = self.kth(self.i)
+        if self.frac == 0:
+            return a
+        return _interpolate(a, self.kth(self.i + 1), self.frac)
+
+    def count_le(self, x):
+        """How many values in the window are <= x."""
+        b = bisect_right(self.maxes, x)
+        smaller = sum(len(bk) for bk in self.buckets[:b])
+        if b < len(self.buckets):
+            smaller += bisect_right(self.buckets[b], x)
+        return smaller
+
+
+ENGINES = {"heaps": HeapPercentile, "buckets": BucketPercentile}
+
+
+# STREAMING API - one result per full window
+def sliding_percentile(iterable, k, q=0.5, engine="buckets"):
+    w = ENGINES[engine](k, q)
+    add, remove, query = w.add, w.remove, w.query
+    window = deque()
+    for x in iterable:
+        add(x)
+        window.append(x)
+        if len(window) > k:
+            remove(window.popleft())
+        if len(window) == k:
+            yield query()
+
+
+def sliding_median(iterable, k, engine="buckets"):
+    return sliding_percentile(iterable, k, 0.5, engine)
+
+
+# CP EXAMPLE - Sliding Window Median (LeetCode 480) / Sliding Median (CSES, lower median)
+def median_sliding_window(nums, k):
+    return [float(m) for m in sliding_median(nums, k)]
+
+
+def cses_sliding_median(nums, k):
+    return list(sliding_percentile(nums, k, (k - 1) // 2 / max(k - 1, 1)))
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    data = [random.random() for _ in range(n)]
+    for k in (10**3, 10**4, 10**5):
+        if k > n:
+            break
+        for name in ENGINES:
+            t = time.perf_counter()
+            for _ in sliding_median(data, k, name):
+                pass
+            dt = time.perf_counter() - t
+            print(f"n={n} k={k:>6} {name:<8} {dt:6.2f}s  {dt / n * 1e6:.2f} us/item")
+
+
+# USAGE
+# for m in sliding_median(stream, 1001): ...
+# p99 = list(sliding_percentile(latencies, 10**4, 0.99))
+# w = BucketPercentile(k, 0.9); w.add(x); w.remove(y); w.query()
+
+# NOTE: values must be orderable; the heap engine also needs -x (numbers)
+# NOTE: remove(x) assumes x is in the window (the streaming API guarantees it)
+# NOTE: python python_sliding_median_ref.py 10000000 for the 10^7 stream
+#       measured us / item (n = 10^6):   k = 10^3   10^4   10^5
+#                             heaps       2.2    2.4    2.6
+#                             buckets     1.6    2.7    4.6
+
+# TIME COMPLEXITY
+# heaps: O(log k) amortized per step, memory O(k) live + O(k) dead max
+# buckets: O(log k + LOAD + k / LOAD) per step, memory O(k)
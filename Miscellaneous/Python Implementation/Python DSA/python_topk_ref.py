@@ -0,0 +1,200 @@
+"""
+CHUNKED TOP-K (NUMPY)
+=====================
+argpartition per chunk + candidate merge: k-th largest, k closest, streams
+"""
+
+import numpy as np
+
+# WHY?
+# find_kth_largest / k_closest in python_heap_ref.py run every element
+# through heapq: ~1 us per element, 10^8 elements = minutes.
+#
+# Chunked selection:
+#   1. filter    drop everything not better than the current k-th best
+#                (one vectorized compare, kills ~all of a random chunk)
+#   2. select    np.argpartition(chunk, k) -> best k of the chunk, O(m)
+#   3. merge     concat with the running best k, select again (2k items)
+# Never sorts more than 2k values; chunks bound the temporaries, so input
+# can be a generator of arrays read from disk (larger than memory).
+
+CHUNK = 1 << 20
+
+
+def _select(scores, index, k, largest):
+    # Positions of the k best scores; ties at the cut go to the lowest index
+    if len(scores) <= k:
+        return np.arange(len(scores))
+    if largest:
+        cut = scores[np.argpartition(scores, len(scores) - k)[len(scores) - k]]
+        better = np.flatnonzero(scores > cut)
+    else:
+        cut = scores[np.argpartition(scores, k - 1)[k - 1]]
+        better = np.flatnonzero(scores < cut)
+    ties = np.flatnonzero(scores == cut)
+    ties = ties[np.argsort(index[ties], kind='stable')[:k - len(better)]]
+    return np.concatenate((better, ties))
+
+
+def _chunks(data, chunk):
+    # One array -> slices; anything else is already an iterable of chunks
+    if isinstance(data, np.ndarray):
+        for s in range(0, len(data), chunk):
+            yield data[s:s + chunk]
+    else:
+        yield from data
+
+
+class TopK:
+    """Running best k of a stream of score arrays.
+
+    largest: keep the k largest scores (False -> k smallest).
+    payload: optional array aligned with scores (e.g. point rows) kept
+    alongside the winners. Ties are broken by arrival order.
+    """
+
+    def __init__(self, k, largest=True):
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        self.k = k
+        self.largest = largest
+        self.seen = 0
+        self.scores = None
+        self.index = np.empty(0, dtype=np.int64)
+        self.payload = None
+
+    def update(self, scores, payload=None):
+        scores = np.asarray(scores).ravel()
+        payload = None if payload is None else np.asarray(payload)
+        index = np.arange(self.seen, self.seen + len(scores))
+        self.seen += len(scores)
+        if self.scores is not None and len(self.scores) == self.k:
+            worst = self.scores.min() if self.largest else self.scores.max()
+            keep = np.flatnonzero(scores > worst if self.largest else scores < worst)
+            scores, index = scores[keep], index[keep]
+            payload = None if payload is None else payload[keep]
+        if len(scores) == 0:
+            return
+        sel = _select(scores, index, self.k, self.largest)
+        scores, index = scores[sel], index[sel]
+        payload = None if payload is None else payload[sel]
+        if self.scores is not None:
+            scores = np.concatenate((self.scores, scores))
+            index = np.concatenate((self.index, index))
+            if payload is not None:
+                payload = np.concatenate((self.payload, payload))
+            sel = _select(scores, index, self.k, self.largest)
+            scores, index = scores[sel], index[sel]
+            payload = None if payload is None else payload[sel]
+        self.scores, self.index, self.payload = scores, index, payload
+
+    def result(self):
+        """(scores, positions[, payload]) best first."""
+        if self.scores is None:
+            raise ValueError("no data")
+        # No -scores: it wraps for unsigned dtypes. Largest first = ascending
+        # (score, -index) reversed; index is int64, so negating it is safe
+        if self.largest:
+            order = np.lexsort((-self.index, self.scores))[::-1]
+        else:
+            order = np.lexsort((self.index, self.scores))
+        out = (self.scores[order], self.index[order])
+        if self.payload is not None:
+            out += (self.payload[order],)
+        return out
+
+
+# K LARGEST / SMALLEST - array or iterable of arrays
+def top_k(data, k, largest=True, chunk=CHUNK):
+    """(values, positions) of the k largest (smallest) values, best first."""
+    tk = TopK(k, largest)
+    for part in _chunks(data, chunk):
+        tk.update(part)
+    return tk.result()
+
+
+def kth_largest(data, k, chunk=CHUNK):
+    values, _ = top_k(data, k, True, chunk)
+    if len(values) < k:
+        raise ValueError(f"only {len(values)} values, k = {k}")
+    return values[-1].item()
+
+
+# K CLOSEST POINTS - squared distances, no sqrt
+def k_closest_points(points, k, origin=None, chunk=CHUNK):
+    """points: (n, d) array or iterable of (m, d) chunks.
+
+    Returns (points, positions, squared distances), closest first.
+    """
+    tk = TopK(k, largest=False)
+    for part in _chunks(points, chunk):
+        part = np.asarray(part)
+        diff = part if origin is None else part - origin
+        dist2 = np.einsum('ij,ij->i', diff, diff)
+        tk.update(dist2, part)
+    dist2, pos, pts = tk.result()
+    return pts, pos, dist2
+
+
+# STREAM SOURCE - binary file larger than memory
+def read_chunks(path, dtype=np.int64, chunk=CHUNK):
+    with open(path, "rb") as f:
+        while True:
+            part = np.fromfile(f, dtype=dtype, count=chunk)
+            if len(part) == 0:
+                return
+            yield part
+
+
+# CP EXAMPLES (same signatures as python_heap_ref.py)
+
+# K-th Largest Element in an Array (LeetCode 215)
+def find_kth_largest(nums, k):
+    return kth_largest(np.asarray(nums), k)
+
+# K Closest Points to Origin (LeetCode 973)
+def k_closest(points, k):
+    return k_closest_points(np.asarray(points), k)[0].tolist()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from python_heap_ref import find_kth_largest as heap_kth_largest
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    k = 100
+    a = np.random.default_rng(0).integers(0, 10**12, n)
+    t = time.perf_counter()
+    top_k(a, k)
+    print(f"n={n} k={k}: top_k {time.perf_counter() - t:.3f}s")
+    u = np.array([0, 2, 1, 2], dtype=np.uint8)
+    assert top_k(u, 4)[0].tolist() == [2, 2, 1, 0] and top_k(u, 4)[1].tolist() == [1, 3, 2, 0]
+    assert kth_largest(u.astype(np.uint64), 4) == 0
+    nums = a[:10**6].tolist()
+    t = time.perf_counter()
+    heap_kth_largest(nums, k)
+    print(f"heapq find_kth_largest on 10^6: {time.perf_counter() - t:.3f}s")
+    pts = np.random.default_rng(1).random((n // 4, 2))
+    t = time.perf_counter()
+    k_closest_points(pts, k)
+    print(f"k_closest_points n={n // 4}: {time.perf_counter() - t:.3f}s")
+
+
+# USAGE
+# top_k(a, 10)                                # 10 largest values + positions
+# top_k(a, 10, largest=False)
+# kth_largest(read_chunks("big.bin"), 1000)   # file larger than memory
+# pts, pos, d2 = k_closest_points(xy, 5, origin=(3, 4))
+#
+# tk = TopK(100)                              # manual streaming
+# for batch in batches: tk.update(batch_scores, batch_rows)
+# scores, positions, rows = tk.result()
+
+# NOTE: positions are offsets in the concatenated stream
+# NOTE: NaN scores are never selected by the filter; drop them first
+
+# TIME COMPLEXITY
+# O(n) total (filter + argpartition per chunk) + O(k log k) final sort
+# Memory: O(chunk + k)
@@ -0,0 +1,194 @@
+"""
+ARRAY-BASED ROOTED TREES & LCA
+==============================
+Parent array + children CSR, BFS order, depth, subtree sizes, binary lifting
+"""
+
+import numpy as np
+
+# WHY?
+# Node objects (TreeNode with .left / .right, as in level_order from
+# python_queue_ref.py) cost ~100 bytes each and one attribute lookup per
+# step. For 10^6 nodes store the tree as arrays instead:
+#   parent[v]                  -1 for the root
+#   kids[ptr[v]:ptr[v + 1]]    children of v (CSR, like CSRGraph)
+#   order                      BFS order: parents always before children
+# Every "bottom-up" pass is a loop over reversed(order), every "top-down"
+# pass a loop over order - no recursion anywhere.
+#
+# LCA - binary lifting:
+#   up[j][v] = 2^j-th ancestor of v (root maps to itself)
+#   up[j] = up[j - 1][up[j - 1]]   -> one NumPy gather per level
+# Queries are answered for a whole batch at once, one gather per level.
+
+
+class RootedTree:
+    def __init__(self, parent, root=None):
+        """parent: sequence / array with parent[root] = -1."""
+        parent = np.asarray(parent, dtype=np.int64)
+        n = self.n = len(parent)
+        if root is None:
+            roots = np.flatnonzero(parent < 0)
+            if len(roots) != 1:
+                raise ValueError(f"expected exactly one root, found {len(roots)}")
+            root = int(roots[0])
+        self.root = root
+        self.parent = parent
+
+        # Children CSR: stable sort by parent, root (parent -1) sorts first
+        kids = np.argsort(parent, kind='stable')[1:]
+        counts = np.bincount(parent[kids], minlength=n)
+        self.ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.ptr[1:])
+        self.kids = kids
+
+        # BFS order: a list may be extended while a for loop walks it
+        ptr = self.ptr.tolist()
+        kid_list = kids.tolist()
+        order = [root]
+        for v in order:
+            order.extend(kid_list[ptr[v]:ptr[v + 1]])
+        if len(order) != n:
+            raise ValueError("parent array has a cycle or several components")
+        self.order = np.array(order, dtype=np.int64)
+
+        par = parent.tolist()
+        depth = [0] * n
+        for v in order[1:]:
+            depth[v] = depth[par[v]] + 1
+        self.depth = np.array(depth, dtype=np.int64)
+        self._up = None
+
+    @classmethod
+    def from_edges(cls, n, u, v, root=0):
+        """From n - 1 undirected edges (arrays or lists)."""
+        from python_csr_graph_ref import CSRGraph
+
+        g = CSRGraph.from_edges(n, u, v, directed=False)
+        ptr, adj = memoryview(g.indptr), memoryview(g.indices)
+        parent = [-1] * n
+        parent[root] = root  # sentinel so the root is never re-entered
+        order = [root]
+        for x in order:
+            px = parent[x]
+            for k in range(ptr[x], ptr[x + 1]):
+                y = adj[k]
+                if y != px and parent[y] == -1:
+                    parent[y] = x
+                    order.append(y)
+        parent[root] = -1
+        if len(order) != n:
+            raise ValueError("edges do not form a connected tree")
+        return cls(parent, root)
+
+    def children(self, v):
+        return self.kids[self.ptr[v]:self.ptr[v + 1]]
+
+    def num_children(self):
+        return np.diff(self.ptr)
+
+    def levels(self):
+        """[[root], [depth-1 nodes], ...] - the tree version of level_order."""
+        order = self.order
+        bounds = np.flatnonzero(np.diff(self.depth[order])) + 1
+        return np.split(order, bounds)
+
+    # BOTTOM-UP
+    def subtree_sizes(self):
+        par = self.parent.tolist()
+        size = [1] * self.n
+        for v in reversed(self.order[1:].tolist()):
+            size[par[v]] += size[v]
+        return np.array(size, dtype=np.int64)
+
+    def subtree_sums(self, values):
+        par = self.parent.tolist()
+        acc = list(values)
+        for v in reversed(self.order[1:].tolist()):
+            acc[par[v]] += acc[v]
+        return acc
+
+    # BINARY LIFTING
+    @property
+    def up(self):
+        """(LOG, n) int32 table, built on first use."""
+        if self._up is None:
+            n = self.n
+            log = max(1, int(self.depth.max()).bit_length())
+            up = np.empty((log, n), dtype=np.int32)
+            up[0] = self.parent
+            up[0, self.root] = self.root
+            for j in range(1, log):
+                up[j] = up[j - 1][up[j - 1]]
+            self._up = up
+        return self._up
+
+    def kth_ancestor_many(self, v, k):
+        """k-th ancestor of every v (-1 if k > depth[v])."""
+        v = np.asarray(v, dtype=np.int64)
+        k = np.broadcast_to(np.asarray(k, dtype=np.int64), v.shape)
+        up = self.up
+        out = v.astype(np.int32)
+        for j in range(len(up)):
+            bit = ((k >> j) & 1).astype(bool)
+            out = np.where(bit, up[j][out], out)
+        return np.where(k <= self.depth[v], out, -1)
+
+    def lca_many(self, u, v):
+        """LCA for every pair (u[i], v[i]); 10^6 queries in well under a second."""
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        depth = self.depth
+        swap = depth[u] < depth[v]
+        u, v = np.where(swap, v, u), np.where(swap, u, v)
+        u = self.kth_ancestor_many(u, depth[u] - depth[v])
+        v = v.astype(np.int32)
+        up = self.up
+        for j in range(len(up) - 1, -1, -1):
+            pu = up[j][u]
+            pv = up[j][v]
+            diff = pu != pv
+            u = np.where(diff, pu, u)
+            v = np.where(diff, pv, v)
+        return np.where(u == v, u, up[0][u]).astype(np.int64)
+
+    def distance_many(self, u, v):
+        depth = self.depth
+        return depth[u] + depth[v] - 2 * depth[self.lca_many(u, v)]
+
+    def lca(self, u, v):
+        return int(self.lca_many([u], [v])[0])
+
+
+# CP EXAMPLES (CSES Tree Algorithms, 0-indexed input)
+
+# Subordinates: boss[i] for employees 1..n-1
+def subordinates(n, boss):
+    parent = np.concatenate(([-1], np.asarray(boss, dtype=np.int64)))
+    return (RootedTree(parent).subtree_sizes() - 1).tolist()
+
+# Company Queries I: k-th boss of x, -1 if none
+def company_queries_1(tree, xs, ks):
+    return tree.kth_ancestor_many(xs, ks).tolist()
+
+# Distance Queries: edges between a and b
+def distance_queries(n, u, v, qa, qb):
+    return RootedTree.from_edges(n, u, v).distance_many(qa, qb).tolist()
+
+
+# USAGE
+# t = RootedTree(parent)                       # parent[root] == -1
+# t = RootedTree.from_edges(n, u, v, root=0)   # from n - 1 undirected edges
+# t.order, t.depth, t.children(v)
+# t.subtree_sizes()
+# t.lca_many(qa, qb)                           # NumPy arrays of queries
+# t.kth_ancestor_many(v, k)
+
+# NOTE: batch the queries - t.lca(u, v) alone pays the full NumPy overhead
+# NOTE: up table for n = 10^6 on a deep tree: 20 x 10^6 int32 = 80 MB
+
+# TIME COMPLEXITY
+# build: O(n log n) for the children sort, O(n) Python loops
+# subtree_sizes / subtree_sums: O(n)
+# up table: O(n log D), D = height
+# lca_many / kth_ancestor_many: O(q log D) element ops, O(log D) NumPy calls
@@ -0,0 +1,175 @@
+"""
+STREAMING SLIDING-WINDOW AGGREGATION
+====================================
+Two-stack queue: any monoid (sum/min/max/gcd/custom), count or time windows
+"""
+
+import operator
+from collections import deque
+from math import gcd
+
+# WHY?
+# The monotonic deque (sliding_window_max in python_common_algos_ref.py)
+# only works for min / max and is usually written over a full list.
+# Two-stack queue works for ANY associative op, with no inverse needed:
+#
+#   front (oldest .. )      back ( .. newest)
+#   [x1 x2 x3]              [x4 x5]
+#   front_agg[i] = x_i op ... op x3   (suffix aggregates, top = oldest)
+#   back_agg     = x4 op x5           (one running value)
+#
+#   push  x     -> back, back_agg = back_agg op x
+#   pop         -> pop front; if front is empty, first flip back into
+#                  front computing suffix aggregates (each item flips once)
+#   query       -> front_agg[top] op back_agg
+# Amortized O(1) op calls per push / pop, order-preserving (op need not
+# be commutative: e.g. matrix product, string concat, affine composition).
+
+INF = float('inf')
+
+
+def _min(a, b):
+    return a if a <= b else b
+
+
+def _max(a, b):
+    return a if a >= b else b
+
+
+# name -> (op, identity)
+MONOIDS = {
+    "sum": (operator.add, 0),
+    "min": (_min, INF),
+    "max": (_max, -INF),
+    "gcd": (gcd, 0),
+    "prod": (operator.mul, 1),
+    "or": (operator.or_, 0),
+    "and": (operator.and_, -1),
+    "xor": (operator.xor, 0),
+}
+
+
+def _monoid(op, identity):
+    if isinstance(op, str):
+        return MONOIDS[op]
+    if identity is None:
+        raise ValueError("a custom op needs its identity element")
+    return op, identity
+
+
+class WindowAggregator:
+    """FIFO window with O(1) amortized aggregate of its contents.
+
+    op: name from MONOIDS or an associative callable(a, b) with `identity`.
+    """
+
+    def __init__(self, op="sum", identity=None):
+        self.op, self.identity = _monoid(op, identity)
+        self.front_vals = []
+        self.front_aggs = []
+        self.back = []
+        self.back_agg = self.identity
+
+    def __len__(self):
+        return len(self.front_vals) + len(self.back)
+
+    def push(self, x):
+        self.back.append(x)
+        self.back_agg = self.op(self.back_agg, x)
+
+    def pop(self):
+        """Remove and return the oldest value."""
+        if not self.front_vals:
+            self._flip()
+        self.front_aggs.pop()
+        return self.front_vals.pop()
+
+    def _flip(self):
+        back = self.back
+        if not back:
+            raise IndexError("pop from an empty window")
+        op = self.op
+        vals = back[::-1]  # newest first, so the oldest ends on top
+        aggs = [None] * len(vals)
+        acc = self.identity
+        for i, x in enumerate(vals):
+            acc = op(x, acc)
+            aggs[i] = acc
+        self.front_vals = vals
+        self.front_aggs = aggs
+        self.back = []
+        self.back_agg = self.identity
+
+    def query(self):
+        """op over the whole window, oldest to newest (identity if empty)."""
+        if self.front_aggs:
+            return self.op(self.front_aggs[-1], self.back_agg)
+        return self.back_agg
+
+
+# COUNT WINDOW - last k items
+def sliding_aggregate(iterable, k, op="sum", identity=None):
+    """Yield the aggregate of every full window of k consecutive items."""
+    w = WindowAggregator(op, identity)
+    push, pop, query = w.push, w.pop, w.query
+    for i, x in enumerate(iterable):
+        push(x)
+        if i >= k:
+            pop()
+        if i >= k - 1:
+            yield query()
+
+
+# TIME WINDOW - items with timestamp in (t - span, t]
+def sliding_aggregate_time(stream, span, op="sum", identity=None):
+    """stream: (timestamp, value) pairs, timestamps non-decreasing.
+
+    Yields (timestamp, aggregate over the last `span` time units) per item.
+    """
+    w = WindowAggregator(op, identity)
+    push, pop, query = w.push, w.pop, w.query
+    times = deque()
+    for t, x in stream:
+        push(x)
+        times.append(t)
+        cutoff = t - span
+        while times[0] <= cutoff:
+            times.popleft()
+            pop()
+        yield t, query()
+
+
+# CP EXAMPLES
+
+# Sliding Window Maximum (LeetCode 239), but on any iterator
+def max_sliding_window(nums, k):
+    return list(sliding_aggregate(nums, k, "max"))
+
+# Windows of k consecutive ints that share a common factor > 1
+def shared_factor_windows(nums, k):
+    return sum(1 for g in sliding_aggregate(nums, k, "gcd") if g > 1)
+
+# Requests per minute from (unix_time, 1) log lines
+def requests_per_minute(events):
+    return sliding_aggregate_time(events, 60, "sum")
+
+
+# USAGE
+# w = WindowAggregator("min")
+# w.push(5); w.push(3); w.query()          # 3
+# w.pop(); w.query()                       # 3 (5 removed)
+#
+# for m in sliding_aggregate(read_numbers(), 1000, "max"): ...
+# for t, s in sliding_aggregate_time(metrics, span=300.0): ...
+#
+# Custom monoid - (count, total) for a rolling mean:
+# pair = lambda a, b: (a[0] + b[0], a[1] + b[1])
+# sliding_aggregate(((1, x) for x in xs), 50, pair, (0, 0))
+
+# NOTE: op must be associative; commutativity is NOT required
+# NOTE: float sums never subtract the leaving value, so no drift from
+#       cancellation (unlike a running total minus the item that left)
+
+# TIME COMPLEXITY
+# push / query: O(1); pop: O(1) amortized (each item flipped once)
+# Memory: O(window size)
@@ -0,0 +1,141 @@
+"""
+VECTORIZED SLIDING MIN / MAX
+============================
+van Herk / Gil-Werman block prefix-suffix method on NumPy arrays, 1D and 2D
+"""
+
+import numpy as np
+
+# WHY?
+# The deque sliding_window_max (python_common_algos_ref.py) is O(n) but
+# pays one Python iteration per element: ~10^6-10^7 elements/s.
+# sliding_window_view(a, k).max(axis=-1) is vectorized but O(n * k).
+#
+# van Herk / Gil-Werman: cut the array into blocks of length k
+#   pre[i] = max of a[block start .. i]      (accumulate, left to right)
+#   suf[i] = max of a[i .. block end]        (accumulate, right to left)
+# Any window [i, i + k - 1] spans at most two blocks, so
+#   window_max(i) = max(suf[i], pre[i + k - 1])
+# -> 3 comparisons per element regardless of k, all inside NumPy.
+#
+# 2D window (kr x kc) is separable: rows first, then columns.
+# Long inputs are processed in chunks (overlap k - 1) to bound temporaries.
+
+CHUNK = 1 << 22  # elements per pass: temporaries stay ~ 3 * CHUNK items
+
+
+def _fill(dtype, ufunc):
+    # Neutral padding: never wins against a real element
+    if np.issubdtype(dtype, np.floating):
+        return np.inf if ufunc is np.minimum else -np.inf
+    if dtype == np.bool_:
+        return ufunc is np.minimum
+    info = np.iinfo(dtype)
+    return info.max if ufunc is np.minimum else info.min
+
+
+def _vhgw(x, k, ufunc, fill, out, scratch):
+    # x: 2D (rows, L), window along the last axis, L >= k; writes L - k + 1
+    # results per row into out. scratch: 3 buffers reused across chunks
+    # (fresh allocations cost more page faults than the math itself)
+    rows, L = x.shape
+    size = rows * (-(-L // k)) * k
+    blocks, pre, suf = (buf[:size].reshape(rows, -1, k) for buf in scratch)
+    flat = blocks.reshape(rows, -1)
+    flat[:, :L] = x
+    flat[:, L:] = fill
+    ufunc.accumulate(blocks, axis=2, out=pre)
+    ufunc.accumulate(blocks[:, :, ::-1], axis=2, out=suf[:, :, ::-1])
+    pre = pre.reshape(rows, -1)
+    suf = suf.reshape(rows, -1)
+    ufunc(suf[:, :L - k + 1], pre[:, k - 1:L], out=out)
+
+
+def _sliding(a, k, axis, ufunc, chunk):
+    a = np.asarray(a)
+    if k < 1:
+        raise ValueError("window must be >= 1")
+    n = a.shape[axis]
+    if k > n:
+        raise ValueError(f"window {k} longer than axis of length {n}")
+    x = np.moveaxis(a, axis, -1)
+    lead = x.shape[:-1]
+    x = x.reshape(-1, n)
+    if k == 1:
+        return np.moveaxis(x.reshape(*lead, n).copy(), -1, axis)
+    fill = _fill(x.dtype, ufunc)
+    rows = x.shape[0]
+    m = n - k + 1
+    out = np.empty((rows, m), dtype=x.dtype)
+    # windows per pass: a multiple of k, at least one block
+    step = min(max(k, (chunk // max(rows, 1)) // k * k), -(-m // k) * k)
+    cap = rows * (step + k)
+    scratch = [np.empty(cap, dtype=x.dtype) for _ in range(3)]
+    for s in range(0, m, step):
+        e = min(m, s + step)
+        _vhgw(x[:, s:e + k - 1], k, ufunc, fill, out[:, s:e], scratch)
+    return np.moveaxis(out.reshape(*lead, m), -1, axis)
+
+
+# 1D (or along one axis of an N-D array), "valid" windows: n - k + 1 outputs
+def sliding_min(a, k, axis=-1, chunk=CHUNK):
+    return _sliding(a, k, axis, np.minimum, chunk)
+
+
+def sliding_max(a, k, axis=-1, chunk=CHUNK):
+    return _sliding(a, k, axis, np.maximum, chunk)
+
+
+# 2D windows kr x kc: output shape (rows - kr + 1, cols - kc + 1)
+def sliding_min_2d(a, kr, kc, chunk=CHUNK):
+    return sliding_min(sliding_min(a, kc, axis=1, chunk=chunk), kr, axis=0, chunk=chunk)
+
+
+def sliding_max_2d(a, kr, kc, chunk=CHUNK):
+    return sliding_max(sliding_max(a, kc, axis=1, chunk=chunk), kr, axis=0, chunk=chunk)
+
+
+# CP EXAMPLES
+
+# Sliding Window Maximum (LeetCode 239)
+def max_sliding_window(nums, k):
+    return sliding_max(np.asarray(nums), k).tolist()
+
+# Largest value in every k x k square of a matrix
+def max_in_squares(grid, k):
+    return sliding_max_2d(np.asarray(grid), k, k)
+
+# Max drawdown-style range: max - min over every window of a price series
+def window_ranges(prices, k):
+    prices = np.asarray(prices)
+    return sliding_max(prices, k) - sliding_min(prices, k)
+
+
+# USAGE
+# sliding_max(a, 1000)                  # len(a) - 999 values
+# sliding_min(img, 5, axis=0)           # per column, along rows
+# sliding_max_2d(img, 3, 3)             # 3 x 3 dilation, "valid" region
+# sliding_min(a, k, chunk=1 << 24)      # bigger passes, more temporaries
+
+# NOTE: works for any dtype with a neutral fill (ints, floats, bools);
+#       NaN propagates through np.minimum / np.maximum
+# NOTE: "same"-size output: np.pad with the fill value first
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**8
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    a = np.random.default_rng(0).random(n)
+    t = time.perf_counter()
+    r = sliding_max(a, k)
+    print(f"n={n} k={k}: sliding_max {time.perf_counter() - t:.2f}s")
+    b = a[:10**6]
+    t = time.perf_counter()
+    np.lib.stride_tricks.sliding_window_view(b, k).max(axis=-1)
+    print(f"sliding_window_view on 10^6: {time.perf_counter() - t:.2f}s")
+
+# TIME COMPLEXITY
+# O(n) per axis, independent of k: ~3 ufunc passes + one copy
+# Memory: O(n) output + O(CHUNK) temporaries